@@ -1,15 +1,15 @@
-"""Video editing commands for the CLI."""
+"""
+Video editing commands for the CLI.
+
+ytdl_app.video pulls in moviepy, which is slow to import, so each command
+imports it when run rather than every CLI invocation paying for it.
+"""
 
 from pathlib import Path
 
 import click
 
-from ytdl_app.video import (
-    TextOverlayConfig,
-    VideoEditor,
-    concatenate_videos,
-    get_video_info,
-)
+from ytdl_app.models import HWAccelConfig
 
 
 @click.command()
@@ -17,12 +17,15 @@ from ytdl_app.video import (
 @click.argument("output_file", type=click.Path(path_type=Path))
 @click.option("--start", type=float, required=True, help="Start time in seconds.")
 @click.option("--end", type=float, required=True, help="End time in seconds.")
-def trim(input_file: Path, output_file: Path, start: float, end: float):
+@click.option("--gpu", is_flag=True, help="Use NVIDIA hardware decoding and encoding.")
+def trim(input_file: Path, output_file: Path, start: float, end: float, gpu: bool):
     """Trim a video to a specific time range."""
+    from ytdl_app.video import VideoEditor
+
     click.echo(f"Trimming {input_file.name} from {start}s to {end}s...")
 
     try:
-        with VideoEditor(input_file) as editor:
+        with VideoEditor(input_file, HWAccelConfig(use_hwaccel=gpu)) as editor:
             editor.trim(start, end).export(output_file)
         click.echo(f"Saved to {output_file}")
     except Exception as e:
@@ -35,8 +38,11 @@ def trim(input_file: Path, output_file: Path, start: float, end: float):
 @click.option(
     "--transition", is_flag=True, help="Use compose transition between clips."
 )
-def concat(output_file: Path, input_files: tuple[Path, ...], transition: bool):
+@click.option("--gpu", is_flag=True, help="Use NVIDIA hardware encoding.")
+def concat(output_file: Path, input_files: tuple[Path, ...], transition: bool, gpu: bool):
     """Concatenate multiple videos into one."""
+    from ytdl_app.video import concatenate_videos
+
     if len(input_files) < 2:
         raise click.ClickException("At least two input files required.")
 
@@ -47,6 +53,7 @@ def concat(output_file: Path, input_files: tuple[Path, ...], transition: bool):
             list(input_files),
             output_file,
             transition="compose" if transition else None,
+            hwaccel=HWAccelConfig(use_hwaccel=gpu),
         )
         click.echo(f"Saved to {output_file}")
     except Exception as e:
@@ -69,6 +76,8 @@ def overlay(
     position: str,
 ):
     """Add a text overlay to a video."""
+    from ytdl_app.video import TextOverlayConfig, VideoEditor
+
     click.echo(f"Adding text overlay to {input_file.name}...")
 
     config = TextOverlayConfig(
@@ -90,6 +99,8 @@ def overlay(
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 def video_info(input_file: Path):
     """Display information about a video file."""
+    from ytdl_app.video import get_video_info
+
     try:
         meta = get_video_info(input_file)
         click.echo(f"File: {meta.path.name}")
@@ -0,0 +1,32 @@
+"""Cached lookups shared across Streamlit reruns."""
+
+from pathlib import Path
+
+import streamlit as st
+
+from ytdl_app.models import VideoMetadata
+from ytdl_app.video import find_keyframe_time, get_video_info
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _probe_video(path: Path, mtime_ns: int, size: int) -> VideoMetadata:
+    """Probe a video; mtime and size are part of the cache key only."""
+    return get_video_info(path)
+
+
+def cached_get_video_info(path: Path) -> VideoMetadata:
+    """Get video metadata, reusing results until the file changes."""
+    stat = path.stat()
+    return _probe_video(path, stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _probe_keyframe(path: Path, time: float, mtime_ns: int, size: int) -> float | None:
+    """Find a keyframe; mtime and size are part of the cache key only."""
+    return find_keyframe_time(path, time)
+
+
+def cached_find_keyframe_time(path: Path, time: float) -> float | None:
+    """Find the keyframe a seek to `time` lands on, cached per file version."""
+    stat = path.stat()
+    return _probe_keyframe(path, time, stat.st_mtime_ns, stat.st_size)
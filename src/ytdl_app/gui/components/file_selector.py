@@ -1,5 +1,6 @@
 """File and directory selection components."""
 
+from collections.abc import Sequence
 from pathlib import Path
 
 import streamlit as st
@@ -86,10 +87,26 @@ def render_directory_selector(
     return default
 
 
+@st.cache_data(ttl=2.0, show_spinner=False)
+def _list_files(directory: Path, extensions: tuple[str, ...] | None) -> list[Path]:
+    """
+    List matching files sorted by name.
+
+    Cached briefly so that selectors sharing a directory and extension set
+    scan it once per rerun instead of once per selector.
+    """
+    files = [
+        f
+        for f in directory.iterdir()
+        if f.is_file() and (extensions is None or f.suffix.lower() in extensions)
+    ]
+    return sorted(files, key=lambda x: x.name.lower())
+
+
 def render_file_selector(
     label: str,
     key: str,
-    extensions: list[str] | None = None,
+    extensions: Sequence[str] | None = None,
     directory: Path | None = None,
 ) -> Path | None:
     """
@@ -98,7 +115,7 @@ def render_file_selector(
     Args:
         label: Label for the selector.
         key: Unique key for the widget.
-        extensions: List of allowed extensions (e.g., [".mp4", ".avi"]).
+        extensions: Allowed extensions (e.g., (".mp4", ".avi")).
         directory: Directory to browse.
 
     Returns:
@@ -110,13 +127,7 @@ def render_file_selector(
         st.warning(f"Directory not found: {directory}")
         return None
 
-    files = []
-    for f in directory.iterdir():
-        if f.is_file():
-            if extensions is None or f.suffix.lower() in extensions:
-                files.append(f)
-
-    files = sorted(files, key=lambda x: x.name.lower())
+    files = _list_files(directory, tuple(extensions) if extensions is not None else None)
 
     if not files:
         ext_str = ", ".join(extensions) if extensions else "any"
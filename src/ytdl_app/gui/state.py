@@ -2,13 +2,21 @@
 
 import streamlit as st
 
+from ytdl_app.models import HWAccelConfig
+
 
 def init_session_state():
     """Initialize all session state variables."""
     defaults = {
         "current_tab": 0,
+        "video_hwaccel": False,
     }
 
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
+
+
+def get_hwaccel_config() -> HWAccelConfig:
+    """Build the hardware encoding config from the session toggle."""
+    return HWAccelConfig(use_hwaccel=st.session_state.get("video_hwaccel", False))
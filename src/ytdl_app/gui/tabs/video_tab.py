@@ -4,12 +4,20 @@ from pathlib import Path
 
 import streamlit as st
 
+from ytdl_app.gui.cache import cached_find_keyframe_time, cached_get_video_info
 from ytdl_app.gui.components import render_directory_selector, render_file_selector
-from ytdl_app.video import TextOverlayConfig, VideoEditor, get_video_info
+from ytdl_app.gui.state import get_hwaccel_config
+from ytdl_app.video import TextOverlayConfig, VideoEditor, extract_frame_at
+from ytdl_app.video.operations import KEYFRAME_TOLERANCE
 
 from .video_effects_tab import render_video_effects
 from .video_transforms_tab import render_video_transforms
 
+# Widget options live at module scope so each rerun reuses the same objects.
+_VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov", ".webm")
+_OVERLAY_COLORS = ("white", "black", "red", "blue", "green", "yellow")
+_OVERLAY_POSITIONS = ("center", "top", "bottom")
+
 
 def _render_trim_section(source_dir: Path):
     """Render the video trimming section."""
@@ -18,13 +26,13 @@ def _render_trim_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video to trim",
         key="trim_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
     if selected_file:
         try:
-            meta = get_video_info(selected_file)
+            meta = cached_get_video_info(selected_file)
             st.info(
                 f"Duration: {meta.format_duration()} | Resolution: {meta.width}x{meta.height}"
             )
@@ -41,6 +49,36 @@ def _render_trim_section(source_dir: Path):
                 "End time (seconds)", min_value=0.0, key="trim_end"
             )
 
+        try:
+            st.image(
+                extract_frame_at(selected_file, start_time),
+                caption=f"Frame at {start_time:.2f}s",
+            )
+        except (OSError, ValueError):
+            st.caption("Preview unavailable")
+
+        keyframe = cached_find_keyframe_time(selected_file, start_time)
+        fast_trim = False
+        if keyframe is not None and abs(keyframe - start_time) < KEYFRAME_TOLERANCE:
+            fast_trim = st.checkbox(
+                "Fast (keyframe) trim",
+                value=True,
+                key="trim_fast",
+                help="Copy streams without re-encoding",
+            )
+        elif keyframe is not None:
+
+            def snap_to_keyframe():
+                st.session_state["trim_start"] = keyframe
+
+            st.caption(f"Previous keyframe: {keyframe:.3f}s")
+            st.button(
+                "Snap start back to keyframe",
+                key="trim_snap_btn",
+                on_click=snap_to_keyframe,
+                help="Start on a keyframe to enable fast trimming",
+            )
+
         output_name = st.text_input(
             "Output filename", value="trimmed_video.mp4", key="trim_output"
         )
@@ -49,8 +87,10 @@ def _render_trim_section(source_dir: Path):
             output_path = source_dir / output_name
             try:
                 with st.spinner("Trimming video..."):
-                    with VideoEditor(selected_file) as editor:
-                        editor.trim(start_time, end_time).export(output_path)
+                    with VideoEditor(selected_file, get_hwaccel_config()) as editor:
+                        editor.trim(start_time, end_time, copy=fast_trim).export(
+                            output_path
+                        )
                 st.success(f"Saved to {output_path}")
             except Exception as e:
                 st.error(f"Trim failed: {e}")
@@ -63,7 +103,7 @@ def _render_overlay_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="overlay_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
@@ -76,13 +116,13 @@ def _render_overlay_section(source_dir: Path):
         with col2:
             color = st.selectbox(
                 "Color",
-                ["white", "black", "red", "blue", "green", "yellow"],
+                _OVERLAY_COLORS,
                 key="overlay_color",
             )
         with col3:
             position = st.selectbox(
                 "Position",
-                ["center", "top", "bottom"],
+                _OVERLAY_POSITIONS,
                 key="overlay_position",
             )
 
@@ -115,13 +155,13 @@ def _render_info_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="info_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
     if selected_file and st.button("Get Info", key="video_info_btn"):
         try:
-            meta = get_video_info(selected_file)
+            meta = cached_get_video_info(selected_file)
             col1, col2 = st.columns(2)
             with col1:
                 st.metric("Duration", meta.format_duration())
@@ -144,6 +184,12 @@ def render_video_tab():
         help_text="Directory containing your video files",
     )
 
+    st.checkbox(
+        "Use GPU acceleration (NVDEC/NVENC)",
+        key="video_hwaccel",
+        help="Decode and encode trim and transform exports on the GPU when available",
+    )
+
     st.divider()
 
     tab1, tab2, tab3, tab4, tab5 = st.tabs(
@@ -4,8 +4,27 @@ from pathlib import Path
 
 import streamlit as st
 
+from ytdl_app.gui.cache import cached_get_video_info
 from ytdl_app.gui.components import render_file_selector
-from ytdl_app.video import CropRegion, RotationAngle, VideoEditor, get_video_info
+from ytdl_app.gui.state import get_hwaccel_config
+from ytdl_app.video import CropRegion, RotationAngle, VideoEditor
+
+# Widget options live at module scope so each rerun reuses the same objects.
+_VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov", ".webm")
+_RESIZE_PRESETS = {
+    "Custom": None,
+    "1080p (1920x1080)": (1920, 1080),
+    "720p (1280x720)": (1280, 720),
+    "480p (854x480)": (854, 480),
+}
+_RESIZE_PRESET_NAMES = tuple(_RESIZE_PRESETS)
+_ROTATE_OPTIONS = {
+    "90° Clockwise": RotationAngle.CW_90,
+    "180°": RotationAngle.CW_180,
+    "90° Counter-clockwise": RotationAngle.CCW_90,
+    "Custom": None,
+}
+_ROTATE_OPTION_NAMES = tuple(_ROTATE_OPTIONS)
 
 
 def _render_speed_section(source_dir: Path):
@@ -15,7 +34,7 @@ def _render_speed_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="speed_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
@@ -38,7 +57,7 @@ def _render_speed_section(source_dir: Path):
             output_path = source_dir / output_name
             try:
                 with st.spinner("Adjusting speed..."):
-                    with VideoEditor(selected_file) as editor:
+                    with VideoEditor(selected_file, get_hwaccel_config()) as editor:
                         editor.speed(speed_factor).export(output_path)
                 st.success(f"Saved to {output_path}")
             except Exception as e:
@@ -52,13 +71,13 @@ def _render_crop_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="crop_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
     if selected_file:
         try:
-            meta = get_video_info(selected_file)
+            meta = cached_get_video_info(selected_file)
             st.info(f"Original size: {meta.width}x{meta.height}")
             max_w, max_h = meta.width, meta.height
         except Exception:
@@ -86,7 +105,7 @@ def _render_crop_section(source_dir: Path):
             output_path = source_dir / output_name
             try:
                 with st.spinner("Cropping video..."):
-                    with VideoEditor(selected_file) as editor:
+                    with VideoEditor(selected_file, get_hwaccel_config()) as editor:
                         editor.crop(region).export(output_path)
                 st.success(f"Saved to {output_path}")
             except Exception as e:
@@ -100,29 +119,26 @@ def _render_resize_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="resize_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
     if selected_file:
         preset = st.selectbox(
             "Resolution preset",
-            ["Custom", "1080p (1920x1080)", "720p (1280x720)", "480p (854x480)"],
+            _RESIZE_PRESET_NAMES,
             key="resize_preset",
         )
 
-        if preset == "Custom":
+        size = _RESIZE_PRESETS[preset]
+        if size is None:
             col1, col2 = st.columns(2)
             with col1:
                 width = st.number_input("Width", min_value=1, value=1280, key="resize_w")
             with col2:
                 height = st.number_input("Height", min_value=1, value=720, key="resize_h")
-        elif "1080p" in preset:
-            width, height = 1920, 1080
-        elif "720p" in preset:
-            width, height = 1280, 720
         else:
-            width, height = 854, 480
+            width, height = size
 
         output_name = st.text_input(
             "Output filename", value="resized_video.mp4", key="resize_output"
@@ -132,7 +148,7 @@ def _render_resize_section(source_dir: Path):
             output_path = source_dir / output_name
             try:
                 with st.spinner("Resizing video..."):
-                    with VideoEditor(selected_file) as editor:
+                    with VideoEditor(selected_file, get_hwaccel_config()) as editor:
                         editor.resize(width=width, height=height).export(output_path)
                 st.success(f"Saved to {output_path}")
             except Exception as e:
@@ -146,25 +162,20 @@ def _render_rotate_section(source_dir: Path):
     selected_file = render_file_selector(
         "Select video",
         key="rotate_video_select",
-        extensions=[".mp4", ".avi", ".mkv", ".mov", ".webm"],
+        extensions=_VIDEO_EXTENSIONS,
         directory=source_dir,
     )
 
     if selected_file:
         rotation = st.selectbox(
             "Rotation",
-            ["90° Clockwise", "180°", "90° Counter-clockwise", "Custom"],
+            _ROTATE_OPTION_NAMES,
             key="rotate_select",
         )
 
-        if rotation == "Custom":
+        angle = _ROTATE_OPTIONS[rotation]
+        if angle is None:
             angle = st.number_input("Custom angle", value=0.0, key="rotate_custom")
-        elif rotation == "90° Clockwise":
-            angle = RotationAngle.CW_90
-        elif rotation == "180°":
-            angle = RotationAngle.CW_180
-        else:
-            angle = RotationAngle.CCW_90
 
         output_name = st.text_input(
             "Output filename", value="rotated_video.mp4", key="rotate_output"
@@ -174,7 +185,7 @@ def _render_rotate_section(source_dir: Path):
             output_path = source_dir / output_name
             try:
                 with st.spinner("Rotating video..."):
-                    with VideoEditor(selected_file) as editor:
+                    with VideoEditor(selected_file, get_hwaccel_config()) as editor:
                         editor.rotate(angle).export(output_path)
                 st.success(f"Saved to {output_path}")
             except Exception as e:
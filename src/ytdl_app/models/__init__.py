@@ -3,6 +3,7 @@
 from .formats import (
     AudioCodec,
     DownloadStatus,
+    HWAccelConfig,
     OutputFormat,
     VideoCodec,
     VideoResolution,
@@ -13,6 +14,7 @@ __all__ = [
     "AudioCodec",
     "AudioMetadata",
     "DownloadStatus",
+    "HWAccelConfig",
     "OutputFormat",
     "VideoCodec",
     "VideoMetadata",
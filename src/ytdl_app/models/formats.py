@@ -1,6 +1,8 @@
 """Output format enums and codec configurations."""
 
+from dataclasses import dataclass
 from enum import Enum
+from typing import Literal
 
 
 class OutputFormat(Enum):
@@ -20,12 +22,21 @@ class OutputFormat(Enum):
     @property
     def is_audio_only(self) -> bool:
         """Check if format is audio-only."""
-        return self in (self.MP3, self.WAV, self.FLAC, self.AAC, self.OGG)
+        return self in _AUDIO_ONLY_FORMATS
 
     @property
     def is_video(self) -> bool:
         """Check if format is a video container."""
-        return self in (self.MP4, self.MKV, self.WEBM, self.AVI, self.MOV)
+        return self in _VIDEO_FORMATS
+
+
+# Defined after the class, since names assigned in an Enum body become members
+_AUDIO_ONLY_FORMATS = frozenset(
+    {OutputFormat.MP3, OutputFormat.WAV, OutputFormat.FLAC, OutputFormat.AAC, OutputFormat.OGG}
+)
+_VIDEO_FORMATS = frozenset(
+    {OutputFormat.MP4, OutputFormat.MKV, OutputFormat.WEBM, OutputFormat.AVI, OutputFormat.MOV}
+)
 
 
 class VideoCodec(Enum):
@@ -48,6 +59,42 @@ class AudioCodec(Enum):
     PCM = "pcm_s16le"
 
 
+@dataclass(frozen=True)
+class HWAccelConfig:
+    """Hardware-accelerated encoding settings."""
+
+    use_hwaccel: bool = False
+    device: Literal["cuda", "vaapi", "qsv", "videotoolbox"] = "cuda"
+    nvenc_preset: str = "p4"
+    nvenc_rc: str = "vbr"
+    nvenc_cq: int = 23
+    hw_decode: bool = True
+
+    @property
+    def encoder(self) -> str:
+        """Get the ffmpeg H.264 encoder name for the configured device."""
+        return {
+            "cuda": "h264_nvenc",
+            "vaapi": "h264_vaapi",
+            "qsv": "h264_qsv",
+            "videotoolbox": "h264_videotoolbox",
+        }[self.device]
+
+    def decoder_params(self) -> list[str]:
+        """Build ffmpeg input parameters for hardware decoding on the device."""
+        if self.device == "vaapi":
+            return ["-hwaccel", "vaapi", "-hwaccel_device", "/dev/dri/renderD128"]
+        return ["-hwaccel", self.device]
+
+    def encoder_params(self) -> list[str]:
+        """Build extra ffmpeg output parameters for the hardware encoder."""
+        if self.device == "cuda":
+            return ["-rc", self.nvenc_rc, "-cq", str(self.nvenc_cq)]
+        if self.device == "vaapi":
+            return ["-vaapi_device", "/dev/dri/renderD128", "-vf", "format=nv12,hwupload"]
+        return []
+
+
 class VideoResolution(Enum):
     """Common video resolutions."""
 
@@ -62,9 +109,12 @@ class VideoResolution(Enum):
     @property
     def height(self) -> int | None:
         """Get the height in pixels."""
-        if self == self.BEST:
-            return None
-        return int(self.value)
+        return _RESOLUTION_HEIGHTS[self]
+
+
+_RESOLUTION_HEIGHTS = {
+    res: None if res is VideoResolution.BEST else int(res.value) for res in VideoResolution
+}
 
 
 class DownloadStatus(Enum):
@@ -1,10 +1,21 @@
 """Metadata dataclasses for video and audio files."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+def _format_duration(duration: float) -> str:
+    """Format a duration in seconds as MM:SS or HH:MM:SS."""
+    total_seconds = int(duration)
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+@dataclass(frozen=True, slots=True)
 class VideoMetadata:
     """Metadata about a video file."""
 
@@ -14,6 +25,7 @@ class VideoMetadata:
     width: int
     height: int
     has_audio: bool
+    _formatted_duration: str = field(init=False, repr=False, compare=False)
 
     @property
     def size(self) -> tuple[int, int]:
@@ -25,18 +37,15 @@ class VideoMetadata:
         """Calculate aspect ratio."""
         return self.width / self.height if self.height > 0 else 0.0
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_formatted_duration", _format_duration(self.duration))
+
     def format_duration(self) -> str:
         """Format duration as MM:SS or HH:MM:SS."""
-        total_seconds = int(self.duration)
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
+        return self._formatted_duration
 
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioMetadata:
     """Metadata about an audio file."""
 
@@ -44,13 +53,11 @@ class AudioMetadata:
     duration: float
     sample_rate: int
     channels: int
+    _formatted_duration: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_formatted_duration", _format_duration(self.duration))
 
     def format_duration(self) -> str:
         """Format duration as MM:SS or HH:MM:SS."""
-        total_seconds = int(self.duration)
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+        return self._formatted_duration
@@ -1,7 +1,16 @@
 """Batch processing for applying operations to multiple files."""
 
-from dataclasses import dataclass, field
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Callable
 
@@ -18,7 +27,7 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchJob:
     """A single job in a batch process."""
 
@@ -59,39 +68,160 @@ class BatchProcessor:
         """Set callback for progress updates."""
         self._on_progress = callback
 
-    def process(self, processor: Callable[[Path, Path, ProjectConfig], None]) -> dict:
+    def process(
+        self,
+        processor: Callable[[Path, Path, ProjectConfig], None],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> dict:
         """
-        Process all jobs using the provided processor function.
+        Process all jobs in parallel using the provided processor function.
+
+        The project's "ffmpeg_threads" metadata entry (default: the usable
+        CPU count) is the total encoder thread budget. Each job gets an
+        equal share of it in its config's "ffmpeg_threads" entry, so parallel
+        jobs use all cores without oversubscribing them.
 
         Args:
             processor: Function that takes (input_path, output_path, config).
+            max_workers: Number of parallel jobs. Defaults to the project's
+                "batch_workers" metadata entry, then the usable CPU count.
+            use_processes: Run jobs in worker processes instead of threads.
+                Threads suit processors that mostly wait on an ffmpeg
+                subprocess; processes suit CPU-bound Python processors, which
+                must then be picklable.
 
         Returns:
             Summary dict with counts of completed/failed jobs.
         """
+        # Deferred: importing ytdl_app.video loads moviepy
+        from ytdl_app.video.ffmpeg import effective_cpu_count
+
+        if max_workers is None:
+            max_workers = self.project.metadata.get("batch_workers") or effective_cpu_count()
+        thread_budget = self.project.metadata.get("ffmpeg_threads") or effective_cpu_count()
+        # Split by the jobs that can actually run at once, not the pool size
+        active = sum(1 for job in self.jobs if job.status != JobStatus.CANCELLED)
+        concurrent = max(1, min(max_workers, active))
+        job_config = replace(
+            self.project,
+            metadata={
+                **self.project.metadata,
+                "ffmpeg_threads": max(1, thread_budget // concurrent),
+            },
+        )
+
+        executor_class: type[Executor] = (
+            ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        )
         completed = 0
         failed = 0
 
-        for job in self.jobs:
-            if job.status == JobStatus.CANCELLED:
-                continue
+        with executor_class(max_workers=max_workers) as executor:
+            running: dict[Future, BatchJob] = {}
+            jobs = iter(self.jobs)
+            while True:
+                # Jobs are submitted only as workers free up, so a job stays
+                # PENDING until it starts and cancel_all() from a progress
+                # callback still stops the jobs that have not started yet.
+                while len(running) < max_workers:
+                    job = next((j for j in jobs if j.status != JobStatus.CANCELLED), None)
+                    if job is None:
+                        break
+
+                    job.status = JobStatus.RUNNING
+                    if self._on_progress:
+                        self._on_progress(job)
+
+                    future = executor.submit(
+                        processor, job.input_file, job.output_file, job_config
+                    )
+                    running[future] = job
+
+                if not running:
+                    break
+
+                # Completions are handled here, on the caller's thread, so
+                # progress callbacks can safely update the UI.
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        future.result()
+                        job.status = JobStatus.COMPLETED
+                        job.progress = 100.0
+                        completed += 1
+                    except Exception as e:
+                        job.status = JobStatus.FAILED
+                        job.error = str(e)
+                        failed += 1
+
+                    if self._on_progress:
+                        self._on_progress(job)
+
+        return {"completed": completed, "failed": failed, "total": len(self.jobs)}
+
+    def process_batched(
+        self,
+        processor_batch: Callable[[list[Path], list[Path], ProjectConfig], None],
+        group_size: int = 16,
+    ) -> dict:
+        """
+        Process jobs in groups, with one processor call per group.
+
+        Suits processors that handle a whole group in a single ffmpeg
+        invocation (see filter_videos_batch), so the per-process startup
+        cost is paid once per group instead of once per file. Jobs in a
+        group complete or fail together.
+
+        Args:
+            processor_batch: Function that takes (input_paths, output_paths, config).
+            group_size: Maximum number of jobs per processor call.
 
-            job.status = JobStatus.RUNNING
+        Returns:
+            Summary dict with counts of completed/failed jobs.
+        """
+        jobs = iter(self.jobs)
+        completed = 0
+        failed = 0
+
+        while True:
+            # Groups are picked as they start, so jobs cancelled from a
+            # progress callback during an earlier group are skipped.
+            group = list(
+                islice((j for j in jobs if j.status != JobStatus.CANCELLED), group_size)
+            )
+            if not group:
+                break
+
+            for job in group:
+                job.status = JobStatus.RUNNING
             if self._on_progress:
-                self._on_progress(job)
+                for job in group:
+                    self._on_progress(job)
 
             try:
-                processor(job.input_file, job.output_file, self.project)
-                job.status = JobStatus.COMPLETED
-                job.progress = 100.0
-                completed += 1
+                processor_batch(
+                    [job.input_file for job in group],
+                    [job.output_file for job in group],
+                    self.project,
+                )
+                error = None
             except Exception as e:
-                job.status = JobStatus.FAILED
-                job.error = str(e)
-                failed += 1
-
-            if self._on_progress:
-                self._on_progress(job)
+                error = str(e)
+
+            for job in group:
+                if error is None:
+                    job.status = JobStatus.COMPLETED
+                    job.progress = 100.0
+                    completed += 1
+                else:
+                    job.status = JobStatus.FAILED
+                    job.error = error
+                    failed += 1
+
+                if self._on_progress:
+                    self._on_progress(job)
 
         return {"completed": completed, "failed": failed, "total": len(self.jobs)}
 
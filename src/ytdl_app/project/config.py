@@ -23,21 +23,34 @@ class OperationType(Enum):
     CONCATENATE = "concatenate"
 
 
-@dataclass
+@dataclass(slots=True)
 class EditOperation:
-    """A single edit operation with parameters."""
+    """
+    A single edit operation with parameters.
+
+    The type and timestamp strings are serialized once and reused by every
+    save until a field is reassigned.
+    """
 
     operation_type: OperationType
     params: dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
+    _cached_fields: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning a field invalidates the cached serialization
+        object.__setattr__(self, name, value)
+        if name != "_cached_fields":
+            object.__setattr__(self, "_cached_fields", None)
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
-        return {
-            "type": self.operation_type.value,
-            "params": self.params,
-            "timestamp": self.timestamp.isoformat(),
-        }
+        if self._cached_fields is None:
+            self._cached_fields = (self.operation_type.value, self.timestamp.isoformat())
+        op_type, timestamp = self._cached_fields
+        return {"type": op_type, "params": self.params, "timestamp": timestamp}
 
     @classmethod
     def from_dict(cls, data: dict) -> "EditOperation":
@@ -49,7 +62,7 @@ class EditOperation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration with all settings and operations."""
 
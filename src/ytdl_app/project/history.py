@@ -1,12 +1,13 @@
 """Undo/redo history for edit operations."""
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HistoryEntry(Generic[T]):
     """A single entry in the history stack."""
 
@@ -18,9 +19,8 @@ class EditHistory(Generic[T]):
     """Manages undo/redo history for editing operations."""
 
     def __init__(self, max_history: int = 50):
-        self._undo_stack: list[HistoryEntry[T]] = []
+        self._undo_stack: deque[HistoryEntry[T]] = deque(maxlen=max_history)
         self._redo_stack: list[HistoryEntry[T]] = []
-        self._max_history = max_history
 
     def push(self, state: T, description: str = "") -> None:
         """
@@ -30,12 +30,10 @@ class EditHistory(Generic[T]):
             state: The state to save (should be a copy/snapshot).
             description: Description of the operation.
         """
+        # The deque's maxlen drops the oldest entry once the limit is reached
         self._undo_stack.append(HistoryEntry(state=state, description=description))
         self._redo_stack.clear()
 
-        if len(self._undo_stack) > self._max_history:
-            self._undo_stack.pop(0)
-
     def undo(self) -> T | None:
         """
         Undo the last operation.
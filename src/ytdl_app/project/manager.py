@@ -1,10 +1,9 @@
 """Project file management (save/load)."""
 
 import json
+import os
 from pathlib import Path
 
-import yaml
-
 from .config import ProjectConfig
 
 
@@ -38,7 +37,12 @@ class ProjectManager:
         if suffix == ".json":
             path.write_text(json.dumps(data, indent=2))
         else:
-            path.write_text(yaml.dump(data, default_flow_style=False))
+            # Imported lazily: PyYAML is slow to import and most sessions never touch YAML
+            import yaml
+
+            # libyaml-backed C dumper, when PyYAML was built with it
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            path.write_text(yaml.dump(data, Dumper=dumper, default_flow_style=False))
 
         return path
 
@@ -63,7 +67,9 @@ class ProjectManager:
         if suffix == ".json":
             data = json.loads(content)
         else:
-            data = yaml.safe_load(content)
+            import yaml
+
+            data = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
         self.project = ProjectConfig.from_dict(data)
         return self.project
@@ -81,7 +87,11 @@ class ProjectManager:
     @staticmethod
     def list_projects(directory: Path) -> list[Path]:
         """List all project files in a directory."""
-        projects = []
-        for ext in ProjectManager.SUPPORTED_FORMATS:
-            projects.extend(directory.glob(f"*{ext}"))
-        return sorted(projects)
+        formats = ProjectManager.SUPPORTED_FORMATS
+        # One scandir pass; DirEntry.is_file uses the cached d_type, so no stat per entry
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1] in formats and entry.is_file()
+            )
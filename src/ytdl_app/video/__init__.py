@@ -8,9 +8,24 @@ from .effects import (
     apply_grayscale,
     apply_sepia,
 )
-from .operations import concatenate_videos, get_video_info
+from .ffmpeg import effective_cpu_count
+from .operations import (
+    can_stream_copy,
+    concatenate_videos,
+    extract_frame_at,
+    filter_videos_batch,
+    find_keyframe_time,
+    get_video_info,
+    trim_stream_copy,
+)
 from .overlay import TextOverlayConfig
-from .subtitles import SubtitleEntry, add_subtitles, add_subtitles_from_file, parse_srt
+from .subtitles import (
+    SubtitleEntry,
+    add_subtitles,
+    add_subtitles_from_file,
+    iter_srt,
+    parse_srt,
+)
 from .transforms import (
     CropRegion,
     RotationAngle,
@@ -37,7 +52,14 @@ __all__ = [
     "apply_rotate",
     "apply_sepia",
     "apply_speed",
+    "can_stream_copy",
     "concatenate_videos",
+    "effective_cpu_count",
+    "extract_frame_at",
+    "filter_videos_batch",
+    "find_keyframe_time",
     "get_video_info",
+    "iter_srt",
     "parse_srt",
+    "trim_stream_copy",
 ]
@@ -0,0 +1,100 @@
+"""Pool of opened source clips reused across editing sessions."""
+
+import atexit
+import threading
+import time
+from pathlib import Path
+
+from moviepy import VideoFileClip
+
+PoolKey = tuple[str, int, int]
+
+
+class ClipPool:
+    """
+    Keeps recently used source clips open between editor sessions.
+
+    Opening a VideoFileClip spawns ffmpeg to parse the file and start the
+    frame and audio readers. Reusing an idle clip of the same, unchanged file
+    skips that startup. A taken clip belongs to one editor until it is put
+    back. Clips left idle for idle_timeout seconds are closed, so a long-lived
+    process (e.g. the Streamlit server) does not keep their ffmpeg readers
+    running.
+    """
+
+    def __init__(self, max_idle: int = 4, idle_timeout: float = 300.0):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._idle: list[tuple[PoolKey, VideoFileClip, float]] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    @staticmethod
+    def key_for(path: Path) -> PoolKey | None:
+        """Build a pool key that changes whenever the file is modified."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def take(self, key: PoolKey | None) -> VideoFileClip | None:
+        """Remove and return an idle clip for the key, if there is one."""
+        if key is None:
+            return None
+        with self._lock:
+            for i, (idle_key, clip, _) in enumerate(self._idle):
+                if idle_key == key:
+                    del self._idle[i]
+                    return clip
+        return None
+
+    def put(self, key: PoolKey | None, clip: VideoFileClip) -> None:
+        """Return a clip to the pool, closing whatever does not fit."""
+        if key is None or self.max_idle <= 0:
+            clip.close()
+            return
+
+        with self._lock:
+            self._idle.append((key, clip, time.monotonic()))
+            evicted = self._idle[: -self.max_idle]
+            del self._idle[: -self.max_idle]
+            self._schedule_expiry()
+
+        for _, old_clip, _ in evicted:
+            old_clip.close()
+
+    def close_expired(self) -> None:
+        """Close clips that have been idle for longer than idle_timeout."""
+        now = time.monotonic()
+        with self._lock:
+            self._timer = None
+            expired = [e for e in self._idle if now - e[2] >= self.idle_timeout]
+            self._idle = [e for e in self._idle if now - e[2] < self.idle_timeout]
+            self._schedule_expiry()
+
+        for _, clip, _ in expired:
+            clip.close()
+
+    def clear(self) -> None:
+        """Close all idle clips."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for _, clip, _ in idle:
+            clip.close()
+
+    def _schedule_expiry(self) -> None:
+        """Start a timer for the oldest idle clip, if none is pending. Needs the lock."""
+        if self._timer is not None or not self._idle:
+            return
+        delay = max(0.0, self._idle[0][2] + self.idle_timeout - time.monotonic())
+        self._timer = threading.Timer(delay, self.close_expired)
+        self._timer.daemon = True
+        self._timer.start()
+
+
+clip_pool = ClipPool()
+atexit.register(clip_pool.clear)
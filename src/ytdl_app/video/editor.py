@@ -1,19 +1,37 @@
 """Video editor class for editing operations."""
 
+import subprocess
+import tempfile
 from pathlib import Path
 
-from moviepy import CompositeVideoClip, TextClip, VideoFileClip
+from moviepy import CompositeVideoClip, TextClip, VideoClip, VideoFileClip
+from moviepy.config import FFMPEG_BINARY
+from moviepy.tools import find_extension
+from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
 
-from ytdl_app.models import VideoMetadata
+from ytdl_app.models import HWAccelConfig, VideoMetadata
 
+from .clip_pool import PoolKey, clip_pool
 from .effects import (
     ColorGrading,
-    apply_blur,
-    apply_color_grading,
-    apply_grayscale,
-    apply_sepia,
+    FrameOp,
+    blur_op,
+    color_grading_op,
+    fuse_ops,
+    grayscale_op,
+    sepia_op,
 )
+from .ffmpeg import (
+    cuda_filter_chain,
+    effective_cpu_count,
+    hw_decoder_params,
+    hw_encoder_kwargs,
+    output_pix_fmt,
+    video_encoder_args,
+)
+from .operations import trim_stream_copy
 from .overlay import TextOverlayConfig
+from .pipeline import run_frame_pipeline
 from .transforms import (
     CropRegion,
     RotationAngle,
@@ -24,38 +42,123 @@ from .transforms import (
 )
 
 
+def _atempo_chain(factor: float) -> list[str]:
+    """Build atempo filters for a speed factor, chaining them below atempo's 0.5 minimum."""
+    filters = []
+    while factor < 0.5:
+        filters.append("atempo=0.5")
+        factor /= 0.5
+    filters.append(f"atempo={factor}")
+    return filters
+
+
+def _rotate_filters(angle: float) -> list[str] | None:
+    """
+    Build rotation filters, or None when moviepy has to do the rotation.
+
+    moviepy rotates within the original canvas, so only half turns have an
+    exact ffmpeg equivalent; transpose would swap the frame dimensions.
+    """
+    return {0: [], 180: ["hflip", "vflip"]}.get(angle % 360)
+
+
 class VideoEditor:
-    """Video editing operations using moviepy."""
+    """
+    Video editing operations using moviepy.
 
-    def __init__(self, input_path: Path):
+    Alongside the moviepy clip, the editor records an equivalent ffmpeg
+    filter chain for operations that ffmpeg can express natively. When the
+    whole chain is expressible, export runs it in a single ffmpeg process
+    instead of piping every frame through Python. Operations without a
+    native equivalent fall back to moviepy for the rest of the session.
+
+    Pixel effects (color grading, grayscale, blur, sepia) are queued rather
+    than applied immediately. Consecutive effects are fused into a single
+    per-frame pass the next time the clip is used, so a chain of N effects
+    walks each frame once instead of N times. Effects still run in call
+    order: every other operation reads the clip, which applies the queue
+    first, so no effect is moved across a trim, resize or other edit.
+    """
+
+    def __init__(self, input_path: Path, hwaccel: HWAccelConfig | None = None):
         self.input_path = Path(input_path)
+        self.hwaccel = hwaccel or HWAccelConfig()
         self._clip: VideoFileClip | None = None
+        self._source: VideoFileClip | None = None
+        self._pool_key: PoolKey | None = None
+        self._stream_copy: tuple[float, float, VideoFileClip] | None = None
+        self._video_filters: list[str] | None = []
+        self._audio_filters: list[str] = []
+        self._input_trim: tuple[float, float] | None = None
+        self._pending_ops: list[FrameOp] = []
+        self._frame_ops: tuple[VideoClip, list[FrameOp], VideoClip] | None = None
 
     def __enter__(self) -> "VideoEditor":
-        self._clip = VideoFileClip(str(self.input_path))
-        return self
+        return self.load()
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
     def close(self) -> None:
-        """Release video resources."""
-        if self._clip is not None:
-            self._clip.close()
-            self._clip = None
+        """Release video resources, returning the source clip to the pool."""
+        if self._source is not None:
+            clip_pool.put(self._pool_key, self._source)
+        self._source = None
+        self._clip = None
 
     @property
     def clip(self) -> VideoFileClip:
-        """Get the current clip."""
+        """Get the current clip, with any queued effects applied."""
         if self._clip is None:
             raise RuntimeError("Video not loaded. Use context manager or load().")
+        self._flush_ops()
         return self._clip
 
     def load(self) -> "VideoEditor":
-        """Load the video file."""
-        self._clip = VideoFileClip(str(self.input_path))
+        """Load the video file, reusing an idle pooled clip when possible."""
+        self.close()
+        self._pool_key = clip_pool.key_for(self.input_path)
+        self._source = clip_pool.take(self._pool_key) or VideoFileClip(
+            str(self.input_path)
+        )
+        self._clip = self._source
+        self._video_filters = []
+        self._audio_filters = []
+        self._input_trim = None
+        self._pending_ops = []
+        self._frame_ops = None
         return self
 
+    def _add_filters(
+        self, video: list[str] | None, audio: list[str] | None = None
+    ) -> None:
+        """Record the ffmpeg filters for an operation; None marks it moviepy-only."""
+        if video is None or self._video_filters is None:
+            self._video_filters = None
+            return
+        self._video_filters.extend(video)
+        self._audio_filters.extend(audio or [])
+
+    def _add_frame_op(self, op: FrameOp) -> None:
+        """Queue a pixel operation to be fused with its neighbours."""
+        if self._clip is None:
+            raise RuntimeError("Video not loaded. Use context manager or load().")
+        self._pending_ops.append(op)
+        self._add_filters(None)
+
+    def _flush_ops(self) -> None:
+        """Apply queued pixel operations to the clip in one fused transform."""
+        if not self._pending_ops:
+            return
+        # Extend the previous fused pass if nothing has touched the clip since
+        base, ops = self._clip, []
+        if self._frame_ops is not None and self._frame_ops[2] is self._clip:
+            base, ops, _ = self._frame_ops
+        ops = [*ops, *self._pending_ops]
+        self._pending_ops = []
+        self._clip = base.image_transform(fuse_ops(ops))
+        self._frame_ops = (base, ops, self._clip)
+
     def get_metadata(self) -> VideoMetadata:
         """Get metadata about the loaded video."""
         return VideoMetadata(
@@ -68,36 +171,60 @@ class VideoEditor:
         )
 
     # Basic operations
-    def trim(self, start: float, end: float) -> "VideoEditor":
-        """Trim the video to a specific time range."""
+    def trim(self, start: float, end: float, copy: bool = False) -> "VideoEditor":
+        """
+        Trim the video to a specific time range.
+
+        Args:
+            start: Start time in seconds.
+            end: End time in seconds.
+            copy: Export by copying streams instead of re-encoding. Only exact
+                when start is on a keyframe, and dropped if further edits
+                are made after the trim.
+        """
         self._clip = self.clip.subclipped(start, end)
+        self._stream_copy = (start, end, self._clip) if copy else None
+        if self._video_filters == [] and not self._audio_filters and self._input_trim is None:
+            # A leading trim becomes an input seek, so ffmpeg skips to the start
+            # instead of decoding and discarding every frame before it
+            self._input_trim = (start, end)
+        else:
+            self._add_filters(
+                [f"trim=start={start}:end={end}", "setpts=PTS-STARTPTS"],
+                [f"atrim=start={start}:end={end}", "asetpts=PTS-STARTPTS"],
+            )
         return self
 
     def adjust_volume(self, factor: float) -> "VideoEditor":
         """Adjust the audio volume (1.0 = original)."""
         if self.clip.audio is not None:
             self._clip = self.clip.with_volume_scaled(factor)
+            self._add_filters([], [f"volume={factor}"])
         return self
 
     # Transformations
     def speed(self, factor: float) -> "VideoEditor":
         """Adjust playback speed (2.0 = double speed, 0.5 = half speed)."""
         self._clip = apply_speed(self.clip, factor)
+        self._add_filters([f"setpts=PTS/{factor}"], _atempo_chain(factor))
         return self
 
     def reverse(self) -> "VideoEditor":
         """Reverse video playback."""
         self._clip = self.clip.time_mirror()
+        self._add_filters(None)
         return self
 
     def loop(self, n_loops: int) -> "VideoEditor":
         """Loop the video n times."""
         self._clip = self.clip.loop(n=n_loops)
+        self._add_filters(None)
         return self
 
     def crop(self, x1: int, y1: int, x2: int, y2: int) -> "VideoEditor":
         """Crop to region (x1, y1) to (x2, y2)."""
         self._clip = apply_crop(self.clip, CropRegion(x1, y1, x2, y2))
+        self._add_filters([f"crop={x2 - x1}:{y2 - y1}:{x1}:{y1}"])
         return self
 
     def resize(
@@ -105,32 +232,37 @@ class VideoEditor:
     ) -> "VideoEditor":
         """Resize video. Maintains aspect ratio if only one dimension given."""
         self._clip = apply_resize(self.clip, width, height)
+        if width or height:
+            # -2 keeps the aspect ratio while rounding to the even sizes H.264 needs
+            self._add_filters([f"scale={width or -2}:{height or -2}"])
         return self
 
     def rotate(self, angle: float | RotationAngle) -> "VideoEditor":
         """Rotate video by angle in degrees."""
         self._clip = apply_rotate(self.clip, angle)
+        degrees = angle.value if isinstance(angle, RotationAngle) else angle
+        self._add_filters(_rotate_filters(degrees))
         return self
 
     # Effects
     def color_grade(self, grading: ColorGrading) -> "VideoEditor":
         """Apply color grading adjustments."""
-        self._clip = apply_color_grading(self.clip, grading)
+        self._add_frame_op(color_grading_op(grading))
         return self
 
     def grayscale(self) -> "VideoEditor":
         """Convert to grayscale."""
-        self._clip = apply_grayscale(self.clip)
+        self._add_frame_op(grayscale_op())
         return self
 
     def blur(self, kernel_size: int = 5) -> "VideoEditor":
         """Apply blur effect."""
-        self._clip = apply_blur(self.clip, kernel_size)
+        self._add_frame_op(blur_op(kernel_size))
         return self
 
     def sepia(self) -> "VideoEditor":
         """Apply sepia tone."""
-        self._clip = apply_sepia(self.clip)
+        self._add_frame_op(sepia_op())
         return self
 
     # Overlays
@@ -144,21 +276,163 @@ class VideoEditor:
             .with_duration(duration)
         )
         self._clip = CompositeVideoClip([self.clip, txt_clip])
+        self._add_filters(None)
         return self
 
     # Export
+    def _write_kwargs(
+        self, codec: str, audio_codec: str, fps: int | None, threads: int | None
+    ) -> dict:
+        """Build write_videofile kwargs, routing to the hardware encoder if enabled."""
+        write_kwargs = {
+            "codec": codec,
+            "audio_codec": audio_codec,
+            "threads": threads or effective_cpu_count(),
+            "logger": None,
+        }
+        if fps:
+            write_kwargs["fps"] = fps
+        write_kwargs.update(hw_encoder_kwargs(self.hwaccel, codec))
+        return write_kwargs
+
+    def _export_filtered(
+        self,
+        output_path: Path,
+        write_kwargs: dict,
+    ) -> Path:
+        """Export by running the recorded filter chain in one ffmpeg process."""
+        encoder_filters, encoder_args = video_encoder_args(write_kwargs)
+        video_filters = self._video_filters + encoder_filters
+        pix_fmt = output_pix_fmt(self.clip.size)
+
+        decoder_params = hw_decoder_params(self.hwaccel)
+        if decoder_params and write_kwargs["codec"] == "h264_nvenc":
+            cuda_filters = cuda_filter_chain(video_filters, pix_fmt)
+            if cuda_filters is not None:
+                # Keep frames in GPU memory from NVDEC through filtering to NVENC
+                decoder_params += ["-hwaccel_output_format", "cuda"]
+                video_filters = cuda_filters
+                pix_fmt = None
+        if encoder_filters:
+            # Encoder upload filters (e.g. VAAPI's format=nv12,hwupload) set the format
+            pix_fmt = None
+
+        cmd = [FFMPEG_BINARY, "-y", "-v", "error", *decoder_params]
+        if self._input_trim is not None:
+            start, end = self._input_trim
+            cmd += ["-ss", str(start), "-to", str(end)]
+        cmd += ["-i", str(self.input_path)]
+        if video_filters:
+            cmd += ["-vf", ",".join(video_filters)]
+        cmd += encoder_args
+        if pix_fmt:
+            cmd += ["-pix_fmt", pix_fmt]
+        if self.clip.audio is not None:
+            if self._audio_filters:
+                cmd += ["-af", ",".join(self._audio_filters)]
+            cmd += ["-c:a", write_kwargs["audio_codec"]]
+        if "fps" in write_kwargs:
+            cmd += ["-r", str(write_kwargs["fps"])]
+        cmd += ["-threads", str(write_kwargs["threads"]), str(output_path)]
+
+        subprocess.run(cmd, capture_output=True, check=True)
+        return output_path
+
     def export(
         self,
         output_path: Path,
         codec: str = "libx264",
         audio_codec: str = "aac",
         fps: int | None = None,
+        threads: int | None = None,
     ) -> Path:
-        """Export the edited video."""
+        """
+        Export the edited video.
+
+        Args:
+            output_path: Destination file.
+            codec: Video codec passed to ffmpeg.
+            audio_codec: Audio codec passed to ffmpeg.
+            fps: Output frame rate. Defaults to the clip's frame rate.
+            threads: Encoder threads. Defaults to the usable CPU count.
+        """
+        self._flush_ops()
+        if self._stream_copy is not None:
+            start, end, trimmed = self._stream_copy
+            if self._clip is trimmed:
+                return trim_stream_copy(self.input_path, output_path, start, end)
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        write_kwargs = {"codec": codec, "audio_codec": audio_codec, "logger": None}
-        if fps:
-            write_kwargs["fps"] = fps
+        write_kwargs = self._write_kwargs(codec, audio_codec, fps, threads)
+        if self._video_filters is not None and (
+            self._video_filters or self._audio_filters or self._input_trim is not None
+        ):
+            return self._export_filtered(output_path, write_kwargs)
         self.clip.write_videofile(str(output_path), **write_kwargs)
         return output_path
+
+    def export_pipelined(
+        self,
+        output_path: Path,
+        codec: str = "libx264",
+        audio_codec: str = "aac",
+        fps: int | None = None,
+        threads: int | None = None,
+        workers: int | None = None,
+        queue_size: int = 8,
+    ) -> Path:
+        """
+        Export through moviepy with decoding, effects and encoding overlapped.
+
+        Effects applied since the last non-pixel operation run on a pool of
+        worker threads between a decoding reader thread and the encoder,
+        instead of serially inside each frame request. Worth it for
+        effect-heavy edits; plain edits are faster with export().
+
+        Args:
+            output_path: Destination file.
+            codec: Video codec passed to ffmpeg.
+            audio_codec: Audio codec passed to ffmpeg.
+            fps: Output frame rate. Defaults to the clip's frame rate.
+            threads: Encoder threads. Defaults to the usable CPU count.
+            workers: Effect threads. Defaults to a quarter of the usable
+                CPUs, between 2 and 4.
+            queue_size: Frames buffered between stages; bounds memory use.
+        """
+        self._flush_ops()
+        source, ops = self._clip, []
+        if self._frame_ops is not None and self._frame_ops[2] is self._clip:
+            source, ops, _ = self._frame_ops
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_kwargs = self._write_kwargs(codec, audio_codec, fps, threads)
+        fps = fps or source.fps
+        workers = workers or min(4, max(2, effective_cpu_count() // 4))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audiofile = None
+            if self.clip.audio is not None:
+                audiofile = str(Path(temp_dir) / f"audio.{find_extension(audio_codec)}")
+                self.clip.audio.write_audiofile(audiofile, codec=audio_codec, logger=None)
+
+            with FFMPEG_VideoWriter(
+                str(output_path),
+                source.size,
+                fps,
+                codec=write_kwargs["codec"],
+                preset=write_kwargs.get("preset", "medium"),
+                audiofile=audiofile,
+                audio_codec="copy",
+                threads=write_kwargs["threads"],
+                ffmpeg_params=write_kwargs.get("ffmpeg_params"),
+            ) as writer:
+                run_frame_pipeline(
+                    source.iter_frames(fps=fps, dtype="uint8"),
+                    ops,
+                    writer.write_frame,
+                    workers=workers,
+                    queue_size=queue_size,
+                )
+        return output_path
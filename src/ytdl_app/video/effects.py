@@ -1,10 +1,43 @@
 """Video effects and color grading."""
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
 import numpy as np
 from moviepy import VideoClip
 
+# A per-frame pixel operation: takes an RGB uint8 frame and returns a new one
+FrameOp = Callable[[np.ndarray], np.ndarray]
+
+# Per-pixel dispatch is kept in the fast numpy paths: matmul runs luma as a
+# BLAS matrix-vector product where np.dot on a 3-D frame loops in C per pixel,
+# and np.take gathers from lookup tables faster than fancy indexing.
+
+# Per-frame math runs in float32: half the memory traffic of float64 and
+# twice the SIMD lanes, while 24 bits of mantissa are ample for 8-bit levels.
+# Temporaries are allocated per frame on purpose: reusing thread-local
+# scratch arrays via out= measured no faster, as the allocator recycles
+# frame-sized blocks without fresh page faults.
+
+# ITU-R BT.601 luma weights for R, G, B
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# The same weights in 8-bit fixed point (sum 256) for integer-only paths
+_LUMA_WEIGHTS_Q8 = (77, 150, 29)
+
+# Contrast pivots on the frame mean estimated from every Nth row and column
+_CONTRAST_SAMPLE_STRIDE = 8
+
+# Transposed so frames can be multiplied directly: (H, W, 3) x (3, 3)
+_SEPIA_MATRIX_T = np.array(
+    [
+        [0.393, 0.769, 0.189],
+        [0.349, 0.686, 0.168],
+        [0.272, 0.534, 0.131],
+    ],
+    dtype=np.float32,
+).T
+
 
 @dataclass
 class ColorGrading:
@@ -16,112 +49,216 @@ class ColorGrading:
     gamma: float = 1.0  # 0.1 to 3.0
 
 
-def _adjust_brightness(frame: np.ndarray, value: float) -> np.ndarray:
-    """Adjust frame brightness."""
-    return np.clip(frame + value * 255, 0, 255).astype(np.uint8)
+def _adjust_brightness(frame: np.ndarray, value: float) -> None:
+    """Adjust frame brightness in place."""
+    frame += value * 255
+    _to_levels(frame)
 
 
-def _adjust_contrast(frame: np.ndarray, value: float) -> np.ndarray:
-    """Adjust frame contrast."""
-    mean = np.mean(frame)
-    return np.clip((frame - mean) * value + mean, 0, 255).astype(np.uint8)
+def _adjust_contrast(frame: np.ndarray, value: float, mean: float) -> None:
+    """Adjust frame contrast around the frame's mean level in place."""
+    frame -= mean
+    frame *= value
+    frame += mean
+    _to_levels(frame)
 
 
-def _adjust_saturation(frame: np.ndarray, value: float) -> np.ndarray:
-    """Adjust frame saturation."""
-    gray = np.dot(frame[..., :3], [0.299, 0.587, 0.114])
-    gray = np.stack([gray] * 3, axis=-1)
-    return np.clip(gray + (frame - gray) * value, 0, 255).astype(np.uint8)
+def _adjust_saturation(frame: np.ndarray, value: float) -> None:
+    """Adjust frame saturation in place."""
+    # Trailing axis of 1 broadcasts across channels instead of stacking copies
+    gray = (frame[..., :3] @ _LUMA_WEIGHTS)[..., None]
+    frame -= gray
+    frame *= value
+    frame += gray
+    _to_levels(frame)
 
 
-def _adjust_gamma(frame: np.ndarray, value: float) -> np.ndarray:
-    """Adjust frame gamma."""
-    normalized = frame / 255.0
-    corrected = np.power(normalized, 1.0 / value)
-    return (corrected * 255).astype(np.uint8)
+def _adjust_gamma(frame: np.ndarray, value: float) -> None:
+    """Adjust frame gamma in place."""
+    frame /= 255.0
+    np.power(frame, 1.0 / value, out=frame)
+    frame *= 255
+    np.trunc(frame, out=frame)
 
 
-def apply_color_grading(clip: VideoClip, grading: ColorGrading) -> VideoClip:
-    """Apply color grading to video."""
+def _to_levels(frame: np.ndarray) -> None:
+    """Clip and truncate a float frame to 8-bit levels in place."""
+    np.clip(frame, 0, 255, out=frame)
+    np.trunc(frame, out=frame)
 
-    def process_frame(frame: np.ndarray) -> np.ndarray:
-        result = frame.astype(np.float64)
 
-        if grading.brightness != 0:
-            result = _adjust_brightness(result, grading.brightness)
+def color_grading_op(grading: ColorGrading) -> FrameOp:
+    """
+    Build the per-frame color grading operation.
 
-        if grading.contrast != 1.0:
-            result = _adjust_contrast(result, grading.contrast)
+    Brightness, contrast and gamma map each 8-bit level independently, so
+    they are applied to a 256-entry lookup table rather than every pixel.
+    Only saturation, which mixes channels, touches the full frame.
+    """
+    levels = np.arange(256, dtype=np.float64)
+    if grading.brightness != 0:
+        _adjust_brightness(levels, grading.brightness)
 
-        if grading.saturation != 1.0:
-            result = _adjust_saturation(result, grading.saturation)
+    gamma_lut = None
+    if grading.gamma != 1.0:
+        gamma_lut = np.arange(256, dtype=np.float64)
+        _adjust_gamma(gamma_lut, grading.gamma)
+        gamma_lut = gamma_lut.astype(np.uint8)
 
-        if grading.gamma != 1.0:
-            result = _adjust_gamma(result, grading.gamma)
+    def process_frame(frame: np.ndarray) -> np.ndarray:
+        lut = levels
+        if grading.contrast != 1.0:
+            # Mean of the brightened frame from the histogram of a strided
+            # sample; a full-frame histogram dominated the cost per frame.
+            sample = frame[::_CONTRAST_SAMPLE_STRIDE, ::_CONTRAST_SAMPLE_STRIDE]
+            hist = np.bincount(sample.ravel(), minlength=256)
+            lut = levels.copy()
+            _adjust_contrast(lut, grading.contrast, float(hist @ levels) / sample.size)
 
-        return result.astype(np.uint8)
+        if grading.saturation == 1.0:
+            lut = lut.astype(np.uint8)
+            if gamma_lut is not None:
+                lut = gamma_lut[lut]
+            return np.take(lut, frame)
 
-    return clip.image_transform(process_frame)
+        result = np.take(lut.astype(np.float32), frame)
+        _adjust_saturation(result, grading.saturation)
+        result = result.astype(np.uint8)
+        return np.take(gamma_lut, result) if gamma_lut is not None else result
 
+    return process_frame
 
-def apply_grayscale(clip: VideoClip) -> VideoClip:
-    """Convert video to grayscale."""
+
+def grayscale_op() -> FrameOp:
+    """Build the per-frame grayscale operation."""
 
     def to_grayscale(frame: np.ndarray) -> np.ndarray:
-        gray = np.dot(frame[..., :3], [0.299, 0.587, 0.114])
-        return np.stack([gray] * 3, axis=-1).astype(np.uint8)
+        gray = (frame[..., :3] @ _LUMA_WEIGHTS).astype(np.uint8)
+        return np.repeat(gray[..., None], 3, axis=-1)
 
-    return clip.image_transform(to_grayscale)
+    return to_grayscale
 
 
-def apply_blur(clip: VideoClip, kernel_size: int = 5) -> VideoClip:
-    """Apply box blur to video."""
+def blur_op(kernel_size: int = 5) -> FrameOp:
+    """Build the per-frame box blur operation."""
     from scipy.ndimage import uniform_filter
 
     def blur_frame(frame: np.ndarray) -> np.ndarray:
-        return uniform_filter(frame, size=(kernel_size, kernel_size, 1)).astype(
-            np.uint8
-        )
+        # uint8 in, uint8 out: the separable passes already return the frame dtype
+        return uniform_filter(frame, size=kernel_size, axes=(0, 1))
 
-    return clip.image_transform(blur_frame)
+    return blur_frame
 
 
-def apply_edge_detection(clip: VideoClip) -> VideoClip:
-    """Apply edge detection filter."""
-    from scipy.ndimage import sobel
+def _luma_int16(frame: np.ndarray) -> np.ndarray:
+    """Integer BT.601 luma: 8-bit fixed-point weights, exact in uint16."""
+    gray = frame[..., 0].astype(np.uint16)
+    gray *= _LUMA_WEIGHTS_Q8[0]
+    for channel in (1, 2):
+        weighted = frame[..., channel].astype(np.uint16)
+        weighted *= _LUMA_WEIGHTS_Q8[channel]
+        gray += weighted
+    gray >>= 8
+    return gray.astype(np.int16)
+
+
+def edge_detection_op() -> FrameOp:
+    """
+    Build the per-frame edge detection operation.
+
+    Runs a Sobel filter in int16 on an integer luma image and takes the
+    gradient magnitude as |gx| + |gy|, the usual sqrt-free approximation.
+    Magnitudes are scaled so the strongest edge in the frame is 255.
+    """
 
     def detect_edges(frame: np.ndarray) -> np.ndarray:
-        gray = np.dot(frame[..., :3], [0.299, 0.587, 0.114])
-        edges_x = sobel(gray, axis=0)
-        edges_y = sobel(gray, axis=1)
-        edges = np.hypot(edges_x, edges_y)
-        edges = (edges / edges.max() * 255).astype(np.uint8)
-        return np.stack([edges] * 3, axis=-1)
+        # Mirrored border, matching scipy.ndimage's default "reflect" mode
+        padded = np.pad(_luma_int16(frame), 1, mode="symmetric")
 
-    return clip.image_transform(detect_edges)
+        # Separable Sobel: [-1, 0, 1] along one axis, [1, 2, 1] along the other
+        dx = padded[:, 2:] - padded[:, :-2]
+        edges = dx[:-2] + dx[2:]
+        edges += dx[1:-1]
+        edges += dx[1:-1]
+        dy = padded[2:] - padded[:-2]
+        edges_y = dy[:, :-2] + dy[:, 2:]
+        edges_y += dy[:, 1:-1]
+        edges_y += dy[:, 1:-1]
 
+        # |gx| + |gy| peaks at 2040, so int16 holds it without overflow
+        np.abs(edges, out=edges)
+        np.abs(edges_y, out=edges_y)
+        edges += edges_y
+        scaled = edges.astype(np.int32)
+        scaled *= 255
+        scaled //= max(int(edges.max()), 1)
+
+        result = np.empty(frame.shape[:2] + (3,), dtype=np.uint8)
+        result[...] = scaled[..., None]
+        return result
+
+    return detect_edges
 
-def apply_invert(clip: VideoClip) -> VideoClip:
-    """Invert video colors."""
+
+def invert_op() -> FrameOp:
+    """Build the per-frame color inversion operation."""
 
     def invert_frame(frame: np.ndarray) -> np.ndarray:
-        return 255 - frame
+        # Not in place: the input may be the decoder's cached frame
+        return np.bitwise_xor(frame, np.uint8(0xFF))
 
-    return clip.image_transform(invert_frame)
+    return invert_frame
 
 
-def apply_sepia(clip: VideoClip) -> VideoClip:
-    """Apply sepia tone filter."""
+def sepia_op() -> FrameOp:
+    """Build the per-frame sepia tone operation."""
 
     def sepia_frame(frame: np.ndarray) -> np.ndarray:
-        sepia_matrix = np.array(
-            [
-                [0.393, 0.769, 0.189],
-                [0.349, 0.686, 0.168],
-                [0.272, 0.534, 0.131],
-            ]
-        )
-        result = np.dot(frame[..., :3], sepia_matrix.T)
-        return np.clip(result, 0, 255).astype(np.uint8)
-
-    return clip.image_transform(sepia_frame)
+        result = frame[..., :3] @ _SEPIA_MATRIX_T
+        return np.clip(result, 0, 255, out=result).astype(np.uint8)
+
+    return sepia_frame
+
+
+def fuse_ops(ops: Sequence[FrameOp]) -> FrameOp:
+    """Combine operations into one, so a clip makes a single transform pass per frame."""
+    ops = tuple(ops)
+    if len(ops) == 1:
+        return ops[0]
+
+    def fused(frame: np.ndarray) -> np.ndarray:
+        for op in ops:
+            frame = op(frame)
+        return frame
+
+    return fused
+
+
+def apply_color_grading(clip: VideoClip, grading: ColorGrading) -> VideoClip:
+    """Apply color grading to video."""
+    return clip.image_transform(color_grading_op(grading))
+
+
+def apply_grayscale(clip: VideoClip) -> VideoClip:
+    """Convert video to grayscale."""
+    return clip.image_transform(grayscale_op())
+
+
+def apply_blur(clip: VideoClip, kernel_size: int = 5) -> VideoClip:
+    """Apply box blur to video."""
+    return clip.image_transform(blur_op(kernel_size))
+
+
+def apply_edge_detection(clip: VideoClip) -> VideoClip:
+    """Apply edge detection filter."""
+    return clip.image_transform(edge_detection_op())
+
+
+def apply_invert(clip: VideoClip) -> VideoClip:
+    """Invert video colors."""
+    return clip.image_transform(invert_op())
+
+
+def apply_sepia(clip: VideoClip) -> VideoClip:
+    """Apply sepia tone filter."""
+    return clip.image_transform(sepia_op())
@@ -0,0 +1,180 @@
+"""FFmpeg capability probing."""
+
+import os
+import shutil
+import subprocess
+from functools import cache
+from pathlib import Path
+
+from moviepy.config import FFMPEG_BINARY
+
+from ytdl_app.models import HWAccelConfig, VideoCodec
+
+# Filters that only retime frames, so they run on GPU-resident frames as is
+_CUDA_SAFE_FILTERS = frozenset({"trim", "setpts"})
+
+
+@cache
+def get_available_encoders() -> frozenset[str]:
+    """Get the names of all encoders compiled into the ffmpeg binary."""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[1] != "=":
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
+def is_encoder_available(name: str) -> bool:
+    """Check if ffmpeg supports the given encoder."""
+    return name in get_available_encoders()
+
+
+@cache
+def get_available_hwaccels() -> frozenset[str]:
+    """Get the names of the hardware decoding methods compiled into ffmpeg."""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-hwaccels"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    # The first line is the "Hardware acceleration methods:" header
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
+
+def hw_encoder_kwargs(hwaccel: HWAccelConfig, codec: str) -> dict:
+    """
+    Get write_videofile overrides that route an H.264 export to the hardware encoder.
+
+    Returns an empty dict when hardware encoding is off, the codec is not
+    H.264, or ffmpeg lacks the device's encoder.
+    """
+    if not (
+        hwaccel.use_hwaccel
+        and codec == VideoCodec.H264.value
+        and is_encoder_available(hwaccel.encoder)
+    ):
+        return {}
+
+    kwargs = {"codec": hwaccel.encoder, "ffmpeg_params": hwaccel.encoder_params()}
+    if hwaccel.device == "cuda":
+        kwargs["preset"] = hwaccel.nvenc_preset
+    return kwargs
+
+
+def video_encoder_args(write_kwargs: dict) -> tuple[list[str], list[str]]:
+    """
+    Translate write_videofile video encoder kwargs into ffmpeg CLI arguments.
+
+    Args:
+        write_kwargs: Dict with "codec" and optionally "preset" and
+            "ffmpeg_params".
+
+    Returns:
+        Tuple of (filters, args). Filters come from a -vf in the encoder
+        params (e.g. VAAPI's hwupload) and must run last in the caller's
+        filter chain; args are the remaining output arguments.
+    """
+    params = list(write_kwargs.get("ffmpeg_params", []))
+    filters = []
+    if "-vf" in params:
+        i = params.index("-vf")
+        filters.append(params[i + 1])
+        del params[i : i + 2]
+
+    args = ["-c:v", write_kwargs["codec"]]
+    if "preset" in write_kwargs:
+        args += ["-preset", write_kwargs["preset"]]
+    return filters, args + params
+
+
+def hw_decoder_params(hwaccel: HWAccelConfig) -> list[str]:
+    """Get ffmpeg input parameters for hardware decoding, if enabled and available."""
+    if hwaccel.use_hwaccel and hwaccel.hw_decode and hwaccel.device in get_available_hwaccels():
+        return hwaccel.decoder_params()
+    return []
+
+
+def output_pix_fmt(size: tuple[int, int]) -> str | None:
+    """
+    Get the -pix_fmt for a native export, matching moviepy's writer.
+
+    Without it ffmpeg keeps the source format, e.g. yuv444p or 10-bit, which
+    many players and h264_nvenc reject. 4:2:0 needs even dimensions, so like
+    moviepy, odd frame sizes keep the source format (None).
+    """
+    width, height = size
+    return "yuv420p" if width % 2 == 0 and height % 2 == 0 else None
+
+
+def cuda_filter_chain(filters: list[str], pix_fmt: str | None = None) -> list[str] | None:
+    """
+    Translate a filter chain to run on frames left in CUDA memory.
+
+    Retiming filters work on GPU frames as they are and scale has a CUDA
+    counterpart. Returns None if any other filter is present, in which case
+    decoded frames must be downloaded to system memory for filtering.
+
+    Args:
+        filters: Software filter chain.
+        pix_fmt: Pixel format to convert to on the GPU at the end of the
+            chain, since -pix_fmt cannot convert GPU-resident frames.
+    """
+    chain = []
+    for video_filter in filters:
+        name, _, args = video_filter.partition("=")
+        if name in _CUDA_SAFE_FILTERS:
+            chain.append(video_filter)
+        elif name == "scale":
+            chain.append(f"scale_cuda={args}")
+        else:
+            return None
+    if pix_fmt:
+        chain.append(f"scale_cuda=format={pix_fmt}")
+    return chain
+
+
+@cache
+def get_ffprobe_binary() -> str | None:
+    """Locate ffprobe, preferring the one next to moviepy's ffmpeg."""
+    sibling = Path(FFMPEG_BINARY).with_name("ffprobe")
+    if sibling.is_file():
+        return str(sibling)
+    return shutil.which("ffprobe")
+
+
+@cache
+def effective_cpu_count() -> int:
+    """
+    Count the CPUs this process may actually use.
+
+    os.cpu_count() reports every core on the host. This honours the
+    scheduler affinity mask and a cgroup v2 CPU quota (e.g. docker --cpus),
+    so thread and worker counts don't oversubscribe a limited container.
+    """
+    count = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 0
+    count = count or os.cpu_count() or 1
+
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+    except (OSError, ValueError):
+        return count
+    if quota == "max":
+        return count
+    return max(1, min(count, int(quota) // int(period)))
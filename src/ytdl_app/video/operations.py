@@ -1,40 +1,489 @@
 """Standalone video operations."""
 
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from moviepy import VideoFileClip, concatenate_videoclips
+from moviepy.config import FFMPEG_BINARY
 
-from ytdl_app.models import VideoMetadata
+from ytdl_app.models import HWAccelConfig, VideoCodec, VideoMetadata
+
+from .clip_pool import clip_pool
+from .ffmpeg import (
+    effective_cpu_count,
+    get_ffprobe_binary,
+    hw_decoder_params,
+    hw_encoder_kwargs,
+    output_pix_fmt,
+    video_encoder_args,
+)
+
+METADATA_CACHE_DIR = Path.home() / ".ytdl_meta"
+
+# Max distance in seconds between a trim start and a keyframe for stream copy
+KEYFRAME_TOLERANCE = 0.04
+
+# Stream fields that must match across inputs for the concat demuxer to copy them.
+# extradata_hash covers the codec headers (H.264 SPS/PPS), which the output
+# takes from the first input only.
+_CONCAT_COPY_FIELDS = (
+    "stream=codec_type,codec_name,profile,level,pix_fmt,width,height,time_base"
+    ",r_frame_rate,avg_frame_rate,sample_aspect_ratio,extradata_hash"
+    ",sample_rate,channels"
+)
+
+# codec_name ffprobe reports for streams written by each encoder
+_ENCODER_CODEC_NAMES = {
+    VideoCodec.H264.value: "h264",
+    VideoCodec.H265.value: "hevc",
+    VideoCodec.VP9.value: "vp9",
+    VideoCodec.AV1.value: "av1",
+}
 
 
 def concatenate_videos(
     video_paths: list[Path],
     output_path: Path,
     transition: str | None = None,
+    codec: str = "libx264",
+    hwaccel: HWAccelConfig | None = None,
 ) -> Path:
-    """Concatenate multiple videos into one."""
+    """
+    Concatenate multiple videos into one.
+
+    Without a transition, inputs whose streams share codec and parameters
+    (already in the requested codec) are joined by the concat demuxer with
+    stream copy, so nothing is decoded or encoded. Failing that, inputs
+    that share a frame size and either all have or all lack audio are
+    joined by ffmpeg's concat filter in a single process, so frames never
+    pass through Python. Other inputs, and ones the concat filter rejects,
+    go through moviepy.
+
+    Args:
+        video_paths: Videos to join, in order.
+        output_path: Destination file.
+        transition: Use compose transitions between clips when set.
+        codec: Video codec for the output.
+        hwaccel: Hardware acceleration settings; when enabled and available,
+            H.264 output goes to the hardware encoder and the native path
+            also decodes on the GPU.
+
+    Returns:
+        Path to the output file.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    hwaccel = hwaccel or HWAccelConfig()
+    write_kwargs = {"codec": codec, "threads": effective_cpu_count(), "logger": None}
+    write_kwargs.update(hw_encoder_kwargs(hwaccel, codec))
+
+    if transition is None:
+        params = [_probe_stream_params(p) for p in video_paths]
+        if params[0] and all(p == params[0] for p in params[1:]):
+            video = next((s for s in params[0] if s.get("codec_type") == "video"), {})
+            if video.get("codec_name") == _ENCODER_CODEC_NAMES.get(codec):
+                return _concatenate_copy(video_paths, output_path)
+
+        infos = [get_video_info(p) for p in video_paths]
+        same_size = len({info.size for info in infos}) == 1
+        audio = {info.has_audio for info in infos}
+        if same_size and len(audio) == 1:
+            try:
+                return _concatenate_native(
+                    video_paths, output_path, infos[0].size, audio.pop(), write_kwargs, hwaccel
+                )
+            except subprocess.CalledProcessError:
+                # The concat filter rejects inputs whose other parameters
+                # differ (e.g. sample aspect ratio); moviepy joins them anyway
+                pass
+
     clips = [VideoFileClip(str(p)) for p in video_paths]
 
     try:
         method = "compose" if transition else "chain"
         final = concatenate_videoclips(clips, method=method)
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        final.write_videofile(str(output_path), logger=None)
+        final.write_videofile(str(output_path), **write_kwargs)
         return output_path
     finally:
         for clip in clips:
             clip.close()
 
 
-def get_video_info(video_path: Path) -> VideoMetadata:
-    """Get metadata about a video file."""
-    with VideoFileClip(str(video_path)) as clip:
+def _probe_stream_params(video_path: Path) -> list[dict] | None:
+    """
+    Read the audio and video stream parameters of a file with ffprobe.
+
+    Returns None if ffprobe is unavailable or fails.
+    """
+    ffprobe = get_ffprobe_binary()
+    if ffprobe is None:
+        return None
+
+    cmd = [
+        ffprobe,
+        "-v", "error",
+        "-show_entries", _CONCAT_COPY_FIELDS,
+        "-show_data_hash", "md5",
+        "-of", "json",
+    ]
+    try:
+        result = subprocess.run(cmd + [str(video_path)], capture_output=True, text=True, check=True)
+        streams = json.loads(result.stdout).get("streams", [])
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError):
+        return None
+    return [s for s in streams if s.get("codec_type") in ("audio", "video")]
+
+
+def _concatenate_copy(video_paths: list[Path], output_path: Path) -> Path:
+    """Concatenate videos with matching streams using the concat demuxer and stream copy."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as list_file:
+        for path in video_paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            list_file.write(f"file '{escaped}'\n")
+
+    cmd = [
+        FFMPEG_BINARY,
+        "-y",
+        "-v", "error",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", list_file.name,
+        "-map", "0:v",
+        "-map", "0:a?",
+        "-c", "copy",
+        str(output_path),
+    ]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+    finally:
+        os.unlink(list_file.name)
+    return output_path
+
+
+def _concatenate_native(
+    video_paths: list[Path],
+    output_path: Path,
+    size: tuple[int, int],
+    has_audio: bool,
+    write_kwargs: dict,
+    hwaccel: HWAccelConfig,
+) -> Path:
+    """Concatenate same-size videos with ffmpeg's concat filter."""
+    cmd = [FFMPEG_BINARY, "-y", "-v", "error"]
+    for path in video_paths:
+        cmd += [*hw_decoder_params(hwaccel), "-i", str(path)]
+
+    streams = "".join(
+        f"[{i}:v][{i}:a]" if has_audio else f"[{i}:v]" for i in range(len(video_paths))
+    )
+    graph = f"{streams}concat=n={len(video_paths)}:v=1:a={int(has_audio)}[v]"
+    if has_audio:
+        graph += "[a]"
+
+    encoder_filters, encoder_args = video_encoder_args(write_kwargs)
+    pix_fmt = output_pix_fmt(size)
+    video_out = "[v]"
+    if encoder_filters:
+        graph += f";[v]{','.join(encoder_filters)}[venc]"
+        video_out = "[venc]"
+        # Encoder upload filters (e.g. VAAPI's format=nv12,hwupload) set the format
+        pix_fmt = None
+
+    cmd += ["-filter_complex", graph, "-map", video_out]
+    if has_audio:
+        cmd += ["-map", "[a]", "-c:a", "aac"]
+    cmd += encoder_args
+    if pix_fmt:
+        cmd += ["-pix_fmt", pix_fmt]
+    cmd += ["-threads", str(write_kwargs["threads"]), str(output_path)]
+
+    subprocess.run(cmd, capture_output=True, check=True)
+    return output_path
+
+
+def extract_frame_at(video_path: Path, time: float) -> np.ndarray:
+    """
+    Decode the frame shown at a given time as an RGB array.
+
+    Uses a pooled clip, so repeated calls on the same file (e.g. while a
+    preview slider is dragged) reuse the open reader instead of starting
+    a new ffmpeg process each time.
+
+    Args:
+        video_path: Path to the video file.
+        time: Time in seconds.
+
+    Returns:
+        Frame as a (height, width, 3) uint8 array.
+    """
+    key = clip_pool.key_for(video_path)
+    clip = clip_pool.take(key) or VideoFileClip(str(video_path))
+    try:
+        return clip.get_frame(time)
+    finally:
+        clip_pool.put(key, clip)
+
+
+def find_keyframe_time(video_path: Path, time: float) -> float | None:
+    """
+    Find the timestamp of the keyframe a seek to `time` would land on.
+
+    Returns None if ffprobe is unavailable or no keyframe was found.
+    """
+    ffprobe = get_ffprobe_binary()
+    if ffprobe is None:
+        return None
+
+    cmd = [
+        ffprobe,
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-skip_frame", "nokey",
+        "-show_frames",
+        "-show_entries", "frame=pts_time",
+        "-read_intervals", f"{time}%+#1",
+        "-of", "json",
+        str(video_path),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        frames = json.loads(result.stdout).get("frames", [])
+        return float(frames[0]["pts_time"]) if frames else None
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+
+def can_stream_copy(video_path: Path, start: float) -> bool:
+    """Check if a trim starting at `start` can skip re-encoding."""
+    keyframe = find_keyframe_time(video_path, start)
+    return keyframe is not None and abs(start - keyframe) < KEYFRAME_TOLERANCE
+
+
+def trim_stream_copy(
+    input_path: Path, output_path: Path, start: float, end: float
+) -> Path:
+    """Trim a video by copying streams instead of re-encoding them."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        FFMPEG_BINARY,
+        "-y",
+        "-v", "error",
+        "-ss", str(start),
+        "-to", str(end),
+        "-i", str(input_path),
+        "-map", "0",
+        "-c", "copy",
+        "-avoid_negative_ts", "make_zero",
+        str(output_path),
+    ]
+    subprocess.run(cmd, capture_output=True, check=True)
+    return output_path
+
+
+def filter_videos_batch(
+    input_paths: list[Path],
+    output_paths: list[Path],
+    video_filter: str,
+    codec: str = "libx264",
+    audio_codec: str = "aac",
+) -> list[Path]:
+    """
+    Apply the same ffmpeg video filter to several files in one ffmpeg process.
+
+    Args:
+        input_paths: Videos to process.
+        output_paths: Output file for each input, in the same order.
+        video_filter: Filter chain applied to every video stream
+            (e.g., "scale=1280:720").
+        codec: Video codec for the outputs.
+        audio_codec: Audio codec for the outputs. Inputs without audio
+            produce outputs without audio.
+
+    Returns:
+        List of output paths.
+    """
+    if len(input_paths) != len(output_paths):
+        raise ValueError("Need exactly one output path per input")
+
+    cmd = [FFMPEG_BINARY, "-y", "-v", "error"]
+    for input_path in input_paths:
+        cmd += ["-i", str(input_path)]
+
+    graph = ";".join(f"[{i}:v]{video_filter}[v{i}]" for i in range(len(input_paths)))
+    cmd += ["-filter_complex", graph]
+
+    outputs = [Path(p) for p in output_paths]
+    for i, output_path in enumerate(outputs):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        cmd += [
+            "-map", f"[v{i}]",
+            "-map", f"{i}:a?",
+            "-c:v", codec,
+            "-c:a", audio_codec,
+            str(output_path),
+        ]
+
+    subprocess.run(cmd, capture_output=True, check=True)
+    return outputs
+
+
+def _metadata_cache_file(video_path: Path) -> Path:
+    """Get the sidecar file holding cached probe results for a video."""
+    key = hashlib.sha1(str(Path(video_path).resolve()).encode()).hexdigest()
+    return METADATA_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached_info(video_path: Path, mtime_ns: int, size: int) -> VideoMetadata | None:
+    """Load cached metadata if the file is unchanged since it was probed."""
+    try:
+        data = json.loads(_metadata_cache_file(video_path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if data.get("mtime_ns") != mtime_ns or data.get("size") != size:
+        return None
+
+    try:
         return VideoMetadata(
             path=video_path,
-            duration=clip.duration,
-            fps=clip.fps,
-            width=clip.size[0],
-            height=clip.size[1],
-            has_audio=clip.audio is not None,
+            duration=data["duration"],
+            fps=data["fps"],
+            width=data["width"],
+            height=data["height"],
+            has_audio=data["has_audio"],
         )
+    except KeyError:
+        return None
+
+
+def _save_cached_info(meta: VideoMetadata, mtime_ns: int, size: int) -> None:
+    """Store probe results so later lookups skip opening the file."""
+    data = {
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "duration": meta.duration,
+        "fps": meta.fps,
+        "width": meta.width,
+        "height": meta.height,
+        "has_audio": meta.has_audio,
+    }
+    try:
+        METADATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _metadata_cache_file(meta.path).write_text(json.dumps(data))
+    except OSError:
+        pass
+
+
+def _parse_frame_rate(rate: str | None) -> float:
+    """Parse an ffprobe rational frame rate such as "30000/1001"."""
+    if not rate:
+        return 0.0
+    num, _, den = rate.partition("/")
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _probe_video_header(video_path: Path) -> VideoMetadata | None:
+    """
+    Read video metadata from the container header with ffprobe.
+
+    Only the fields VideoMetadata needs are requested, and stream analysis is
+    disabled so ffprobe stops after the header instead of decoding frames.
+    Returns None if ffprobe is unavailable or the header is incomplete.
+    """
+    ffprobe = get_ffprobe_binary()
+    if ffprobe is None:
+        return None
+
+    cmd = [
+        ffprobe,
+        "-v", "error",
+        "-probesize", "5000000",
+        "-analyzeduration", "0",
+        "-fflags", "+fastseek",
+        "-show_entries",
+        "stream=codec_type,width,height,avg_frame_rate,r_frame_rate"
+        ":stream_tags=rotate:stream_side_data=rotation:format=duration",
+        "-of", "json",
+        str(video_path),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        data = json.loads(result.stdout)
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError):
+        return None
+
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        return None
+
+    fps = _parse_frame_rate(video.get("avg_frame_rate")) or _parse_frame_rate(
+        video.get("r_frame_rate")
+    )
+    try:
+        duration = float(data.get("format", {})["duration"])
+        width, height = int(video["width"]), int(video["height"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not fps or not duration:
+        return None
+
+    rotation = video.get("tags", {}).get("rotate")
+    for side_data in video.get("side_data_list", []):
+        rotation = side_data.get("rotation", rotation)
+    if rotation is not None and abs(int(float(rotation))) % 180 == 90:
+        width, height = height, width
+
+    return VideoMetadata(
+        path=video_path,
+        duration=duration,
+        fps=fps,
+        width=width,
+        height=height,
+        has_audio=any(s.get("codec_type") == "audio" for s in streams),
+    )
+
+
+def get_video_info(video_path: Path) -> VideoMetadata:
+    """
+    Get metadata about a video file.
+
+    Results are memoized in process and in a sidecar cache on disk, both
+    keyed by the file's mtime and size, so repeated lookups (e.g. archive
+    scans) cost one stat call.
+    """
+    stat = Path(video_path).stat()
+    return _video_info(video_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _video_info(video_path: Path, mtime_ns: int, size: int) -> VideoMetadata:
+    """Probe a given version of a video file, preferring the sidecar cache."""
+    cached = _load_cached_info(video_path, mtime_ns, size)
+    if cached is not None:
+        return cached
+
+    meta = _probe_video_header(video_path)
+    if meta is None:
+        with VideoFileClip(str(video_path)) as clip:
+            meta = VideoMetadata(
+                path=video_path,
+                duration=clip.duration,
+                fps=clip.fps,
+                width=clip.size[0],
+                height=clip.size[1],
+                has_audio=clip.audio is not None,
+            )
+
+    _save_cached_info(meta, mtime_ns, size)
+    return meta
@@ -0,0 +1,77 @@
+"""Pipelined decode, transform and encode of video frames."""
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from .effects import FrameOp, fuse_ops
+
+_DONE = object()
+
+
+def run_frame_pipeline(
+    frames: Iterable[np.ndarray],
+    ops: Sequence[FrameOp],
+    write: Callable[[np.ndarray], None],
+    workers: int = 2,
+    queue_size: int = 8,
+) -> int:
+    """
+    Run frames through ops with decoding, processing and encoding overlapped.
+
+    A reader thread pulls decoded frames and submits them to a pool of
+    worker threads; the calling thread writes the results in input order.
+    ffmpeg pipe I/O and numpy release the GIL, so the stages run
+    concurrently and throughput approaches the slowest stage rather than
+    the sum of all three.
+
+    Args:
+        frames: Decoded frames, e.g. from clip.iter_frames().
+        ops: Operations applied to each frame in order.
+        write: Callback receiving each processed frame.
+        workers: Number of threads running ops.
+        queue_size: Frames in flight between reader and writer; bounds memory.
+
+    Returns:
+        Number of frames written.
+    """
+    pending: queue.Queue[Future | object] = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: list[Exception] = []
+
+    process = fuse_ops(ops)
+
+    def read(executor: ThreadPoolExecutor) -> None:
+        try:
+            for frame in frames:
+                if stop.is_set():
+                    break
+                pending.put(executor.submit(process, frame))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            pending.put(_DONE)
+
+    written = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        reader = threading.Thread(target=read, args=(executor,), daemon=True)
+        reader.start()
+        try:
+            while (item := pending.get()) is not _DONE:
+                write(item.result())
+                written += 1
+        finally:
+            # Unblock the reader if the writer stopped early
+            stop.set()
+            while reader.is_alive():
+                try:
+                    pending.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+    if errors:
+        raise errors[0]
+    return written
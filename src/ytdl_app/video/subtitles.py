@@ -1,9 +1,23 @@
 """Subtitle handling for videos."""
 
+import bisect
+import mmap
+import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from moviepy import CompositeVideoClip, TextClip, VideoClip
+import numpy as np
+from moviepy import TextClip, VideoClip
+from moviepy.tools import compute_position
+
+# An SRT cue: "HH:MM:SS,mmm --> HH:MM:SS,mmm" line, then text up to the next
+# blank line. Matching whole cues with one regex keeps the tokenizing in C.
+# Bytes patterns so cues can be matched straight from a memory-mapped file.
+_SRT_TIME = rb"(\d+):(\d{2}):(\d{2}[,.]\d{3})"
+_SRT_CUE = re.compile(
+    rb"%s *--> *%s[^\n]*\n([^\n]+(?:\n[^\n]*\S[^\n]*)*)" % (_SRT_TIME, _SRT_TIME)
+)
 
 
 @dataclass
@@ -19,63 +33,113 @@ class SubtitleEntry:
         return self.end_time - self.start_time
 
 
-def parse_srt(srt_path: Path) -> list[SubtitleEntry]:
-    """Parse an SRT subtitle file."""
-    entries = []
-    content = srt_path.read_text(encoding="utf-8")
-    blocks = content.strip().split("\n\n")
-
-    for block in blocks:
-        lines = block.strip().split("\n")
-        if len(lines) >= 3:
-            time_line = lines[1]
-            text = "\n".join(lines[2:])
-
-            start_str, end_str = time_line.split(" --> ")
-            start_time = _parse_srt_time(start_str.strip())
-            end_time = _parse_srt_time(end_str.strip())
-
-            entries.append(SubtitleEntry(start_time, end_time, text))
+def iter_srt(srt_path: Path) -> Iterator[SubtitleEntry]:
+    """
+    Lazily parse an SRT subtitle file.
 
-    return entries
+    The file is memory-mapped and cues are matched in place, so only the
+    text of each cue is decoded and memory use does not grow with file size.
+    """
+    with open(srt_path, "rb") as f:
+        # mmap cannot map an empty file
+        if not f.seek(0, 2):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in _SRT_CUE.finditer(content):
+                h1, m1, s1, h2, m2, s2, text = match.groups()
+                yield SubtitleEntry(
+                    _srt_seconds(h1, m1, s1),
+                    _srt_seconds(h2, m2, s2),
+                    text.decode("utf-8").replace("\r\n", "\n").rstrip(),
+                )
 
 
-def _parse_srt_time(time_str: str) -> float:
-    """Parse SRT timestamp to seconds."""
-    time_str = time_str.replace(",", ".")
-    parts = time_str.split(":")
-    hours = int(parts[0])
-    minutes = int(parts[1])
-    seconds = float(parts[2])
-    return hours * 3600 + minutes * 60 + seconds
+def parse_srt(srt_path: Path) -> list[SubtitleEntry]:
+    """Parse an SRT subtitle file."""
+    return list(iter_srt(srt_path))
+
+
+def _srt_seconds(hours: bytes, minutes: bytes, seconds: bytes) -> float:
+    """Convert captured SRT timestamp fields to seconds."""
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds.replace(b",", b"."))
+
+
+def _rasterize(
+    text: str, font_size: int, color: str, bg_color: str | None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Render subtitle text to an RGB bitmap and alpha, or None when opaque."""
+    txt_clip = TextClip(text=text, font_size=font_size, color=color, bg_color=bg_color)
+    bitmap = txt_clip.get_frame(0).astype(np.uint8)
+    alpha = txt_clip.mask.get_frame(0) if txt_clip.mask is not None else None
+    if alpha is not None and alpha.min() < 1.0:
+        return bitmap, alpha[..., None]
+    return bitmap, None
+
+
+def _blit(
+    frame: np.ndarray, bitmap: np.ndarray, alpha: np.ndarray | None, x: int, y: int
+) -> None:
+    """Draw a bitmap onto a frame at (x, y) in place, clipped to the frame."""
+    height, width = frame.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + bitmap.shape[1], width), min(y + bitmap.shape[0], height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    src = bitmap[y0 - y : y1 - y, x0 - x : x1 - x]
+    if alpha is None:
+        frame[y0:y1, x0:x1] = src
+        return
+    a = alpha[y0 - y : y1 - y, x0 - x : x1 - x]
+    region = frame[y0:y1, x0:x1]
+    region[...] = np.rint(src * a + region * (1 - a))
 
 
 def add_subtitles(
     clip: VideoClip,
-    subtitles: list[SubtitleEntry],
+    subtitles: Iterable[SubtitleEntry],
     font_size: int = 24,
     color: str = "white",
     bg_color: str = "black",
     position: str = "bottom",
 ) -> VideoClip:
-    """Add subtitles to a video clip."""
-    subtitle_clips = []
-
+    """
+    Add subtitles to a video clip.
+
+    Each distinct text is rasterized once, and subtitles are drawn onto the
+    frame directly instead of compositing one clip per entry. The entries
+    showing at a frame are found by binary search over their start times.
+    """
+    subtitles = list(subtitles)
+    bitmaps: dict[str, tuple[np.ndarray, np.ndarray | None, tuple[int, int]]] = {}
     for entry in subtitles:
-        txt_clip = (
-            TextClip(
-                text=entry.text,
-                font_size=font_size,
-                color=color,
-                bg_color=bg_color,
+        if entry.text not in bitmaps:
+            bitmap, alpha = _rasterize(entry.text, font_size, color, bg_color)
+            pos = compute_position(
+                (bitmap.shape[1], bitmap.shape[0]), clip.size, ("center", position)
             )
-            .with_position(("center", position))
-            .with_start(entry.start_time)
-            .with_duration(entry.duration)
-        )
-        subtitle_clips.append(txt_clip)
+            bitmaps[entry.text] = (bitmap, alpha, pos)
+
+    # Sorted by start; ties and overlaps are drawn in the caller's order
+    order = sorted(range(len(subtitles)), key=lambda i: subtitles[i].start_time)
+    starts = [subtitles[i].start_time for i in order]
+    longest = max((entry.duration for entry in subtitles), default=0.0)
+
+    def draw(get_frame, t: float) -> np.ndarray:
+        frame = get_frame(t)
+        # Only entries starting within the longest duration before t can be showing
+        lo = bisect.bisect_right(starts, t - longest - 1e-9)
+        hi = bisect.bisect_right(starts, t)
+        active = sorted(i for i in order[lo:hi] if t < subtitles[i].end_time)
+        if not active:
+            return frame
+
+        frame = frame.copy()
+        for i in active:
+            bitmap, alpha, (x, y) = bitmaps[subtitles[i].text]
+            _blit(frame, bitmap, alpha, int(x), int(y))
+        return frame
 
-    return CompositeVideoClip([clip] + subtitle_clips)
+    return clip.transform(draw)
 
 
 def add_subtitles_from_file(
@@ -85,5 +149,4 @@ def add_subtitles_from_file(
     color: str = "white",
 ) -> VideoClip:
     """Add subtitles from an SRT file."""
-    subtitles = parse_srt(srt_path)
-    return add_subtitles(clip, subtitles, font_size, color)
+    return add_subtitles(clip, iter_srt(srt_path), font_size, color)
@@ -1,6 +1,6 @@
 """Shared test fixtures and configuration."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -51,6 +51,15 @@ def mock_video_clip():
     return clip
 
 
+@pytest.fixture
+def mock_ydl():
+    """Patch yt_dlp.YoutubeDL for the downloader and return the instance used in `with`."""
+    with patch("ytdl_app.download.downloader.yt_dlp.YoutubeDL") as mock_ydl_class:
+        ydl = mock_ydl_class.return_value
+        ydl.__enter__.return_value = ydl
+        yield ydl
+
+
 @pytest.fixture
 def mock_yt_dlp_info():
     """Sample yt-dlp info dictionary."""
@@ -71,3 +80,9 @@ def mock_yt_dlp_info():
             {"format_id": "22", "ext": "mp4", "resolution": "720p"},
         ],
     }
+
+
+@pytest.fixture
+def mock_yt_dlp_playlist_info(mock_yt_dlp_info):
+    """Sample yt-dlp info dictionary for a two-video playlist."""
+    return {**mock_yt_dlp_info, "entries": [{"title": "Video 1"}, {"title": "Video 2"}]}
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from ytdl_app.download import DownloadConfig
 from ytdl_app.models import OutputFormat, VideoResolution
 
@@ -16,36 +18,27 @@ class TestDownloadConfig:
         assert config.resolution == VideoResolution.BEST
         assert config.retries == 3
 
-    def test_output_template_single(self):
-        """Single video template should not include playlist."""
+    @pytest.mark.parametrize("is_playlist", [False, True], ids=["single", "playlist"])
+    def test_output_template(self, is_playlist):
+        """Only the playlist template should include the playlist folder."""
         config = DownloadConfig(output_dir=Path("/tmp"))
-        template = config.get_output_template(is_playlist=False)
+        template = config.get_output_template(is_playlist=is_playlist)
         assert "%(title)s" in template
-        assert "%(playlist)s" not in template
-
-    def test_output_template_playlist(self):
-        """Playlist template should include playlist folder."""
-        config = DownloadConfig(output_dir=Path("/tmp"))
-        template = config.get_output_template(is_playlist=True)
-        assert "%(playlist)s" in template
-
-    def test_format_string_video(self):
-        """Video format string should prefer mp4."""
-        config = DownloadConfig(output_format=OutputFormat.MP4)
-        fmt = config.get_format_string()
-        assert "mp4" in fmt
-
-    def test_format_string_audio(self):
-        """Audio format string should select best audio."""
-        config = DownloadConfig(output_format=OutputFormat.MP3)
-        fmt = config.get_format_string()
-        assert "ba" in fmt  # best audio
-
-    def test_format_string_with_resolution(self):
-        """Format string should include height limit."""
-        config = DownloadConfig(resolution=VideoResolution.R_720P)
-        fmt = config.get_format_string()
-        assert "720" in fmt
+        assert ("%(playlist)s" in template) is is_playlist
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"output_format": OutputFormat.MP4}, "mp4"),  # prefers mp4
+            ({"output_format": OutputFormat.MP3}, "ba"),  # best audio
+            ({"resolution": VideoResolution.R_720P}, "720"),  # height limit
+        ],
+        ids=["video", "audio", "resolution"],
+    )
+    def test_format_string(self, kwargs, expected):
+        """Format string should reflect the output format and resolution."""
+        fmt = DownloadConfig(**kwargs).get_format_string()
+        assert expected in fmt
 
     def test_to_ydl_opts_includes_retries(self):
         """YDL options should include retry settings."""
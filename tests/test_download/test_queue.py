@@ -73,8 +73,7 @@ class TestDownloadQueue:
     def test_clear_completed(self):
         """Clear completed should remove finished items."""
         queue = DownloadQueue()
-        item1 = queue.add("https://example.com/1")
-        item2 = queue.add("https://example.com/2")
+        item1, _ = queue.add_batch(["https://example.com/1", "https://example.com/2"])
 
         queue.update_status(item1.id, DownloadStatus.COMPLETED)
 
@@ -95,8 +94,7 @@ class TestDownloadQueue:
     def test_get_by_status(self):
         """Should filter items by status."""
         queue = DownloadQueue()
-        item1 = queue.add("https://example.com/1")
-        item2 = queue.add("https://example.com/2")
+        item1, _ = queue.add_batch(["https://example.com/1", "https://example.com/2"])
         queue.update_status(item1.id, DownloadStatus.COMPLETED)
 
         completed = queue.get_by_status(DownloadStatus.COMPLETED)
@@ -1,42 +1,86 @@
 """Tests for format enums."""
 
-from ytdl_app.models import DownloadStatus, OutputFormat, VideoResolution
+import pytest
+
+from ytdl_app.models import (
+    DownloadStatus,
+    HWAccelConfig,
+    OutputFormat,
+    VideoResolution,
+)
 
 
 class TestOutputFormat:
     """Tests for OutputFormat enum."""
 
-    def test_audio_only_formats(self):
+    @pytest.mark.parametrize(
+        ("fmt", "expected"),
+        [
+            (OutputFormat.MP3, True),
+            (OutputFormat.WAV, True),
+            (OutputFormat.FLAC, True),
+            (OutputFormat.MP4, False),
+            (OutputFormat.MKV, False),
+        ],
+    )
+    def test_is_audio_only(self, fmt, expected):
         """Audio-only formats should be identified correctly."""
-        assert OutputFormat.MP3.is_audio_only
-        assert OutputFormat.WAV.is_audio_only
-        assert OutputFormat.FLAC.is_audio_only
-        assert not OutputFormat.MP4.is_audio_only
-        assert not OutputFormat.MKV.is_audio_only
+        assert fmt.is_audio_only is expected
 
-    def test_video_formats(self):
+    @pytest.mark.parametrize(
+        ("fmt", "expected"),
+        [
+            (OutputFormat.MP4, True),
+            (OutputFormat.MKV, True),
+            (OutputFormat.WEBM, True),
+            (OutputFormat.MP3, False),
+            (OutputFormat.WAV, False),
+        ],
+    )
+    def test_is_video(self, fmt, expected):
         """Video formats should be identified correctly."""
-        assert OutputFormat.MP4.is_video
-        assert OutputFormat.MKV.is_video
-        assert OutputFormat.WEBM.is_video
-        assert not OutputFormat.MP3.is_video
-        assert not OutputFormat.WAV.is_video
+        assert fmt.is_video is expected
 
 
 class TestVideoResolution:
     """Tests for VideoResolution enum."""
 
-    def test_height_values(self):
+    @pytest.mark.parametrize(
+        ("resolution", "height"),
+        [
+            (VideoResolution.R_720P, 720),
+            (VideoResolution.R_1080P, 1080),
+            (VideoResolution.R_2160P, 2160),
+        ],
+    )
+    def test_height(self, resolution, height):
         """Resolution heights should be correct."""
-        assert VideoResolution.R_720P.height == 720
-        assert VideoResolution.R_1080P.height == 1080
-        assert VideoResolution.R_2160P.height == 2160
+        assert resolution.height == height
 
     def test_best_has_no_height(self):
         """BEST resolution should return None for height."""
         assert VideoResolution.BEST.height is None
 
 
+class TestHWAccelConfig:
+    """Tests for HWAccelConfig dataclass."""
+
+    def test_defaults_disabled(self):
+        """Hardware acceleration should be off by default."""
+        assert HWAccelConfig().use_hwaccel is False
+
+    def test_encoder_per_device(self):
+        """Each device should map to its H.264 encoder."""
+        assert HWAccelConfig(device="cuda").encoder == "h264_nvenc"
+        assert HWAccelConfig(device="qsv").encoder == "h264_qsv"
+        assert HWAccelConfig(device="videotoolbox").encoder == "h264_videotoolbox"
+
+    def test_decoder_params(self):
+        """Decoder params should select the device's hwaccel method."""
+        assert HWAccelConfig().decoder_params() == ["-hwaccel", "cuda"]
+        assert HWAccelConfig(device="vaapi").decoder_params()[:2] == ["-hwaccel", "vaapi"]
+
+
 class TestDownloadStatus:
     """Tests for DownloadStatus enum."""
 
@@ -6,79 +6,71 @@ import pytest
 
 from ytdl_app.models import AudioMetadata, VideoMetadata
 
+TEST_MP4 = Path("test.mp4")
+TEST_MP3 = Path("test.mp3")
 
-class TestVideoMetadata:
-    """Tests for VideoMetadata dataclass."""
 
-    def test_size_property(self):
-        """Size should return (width, height) tuple."""
-        meta = VideoMetadata(
-            path=Path("test.mp4"),
-            duration=60.0,
+@pytest.fixture
+def video_meta():
+    """Build 1080p30 VideoMetadata with a given duration."""
+
+    def make(duration: float = 60.0) -> VideoMetadata:
+        return VideoMetadata(
+            path=TEST_MP4,
+            duration=duration,
             fps=30.0,
             width=1920,
             height=1080,
             has_audio=True,
         )
-        assert meta.size == (1920, 1080)
 
-    def test_aspect_ratio(self):
-        """Aspect ratio should be calculated correctly."""
-        meta = VideoMetadata(
-            path=Path("test.mp4"),
-            duration=60.0,
-            fps=30.0,
-            width=1920,
-            height=1080,
-            has_audio=True,
+    return make
+
+
+@pytest.fixture
+def audio_meta():
+    """Build 44.1 kHz stereo AudioMetadata with a given duration."""
+
+    def make(duration: float = 60.0) -> AudioMetadata:
+        return AudioMetadata(
+            path=TEST_MP3,
+            duration=duration,
+            sample_rate=44100,
+            channels=2,
         )
-        assert abs(meta.aspect_ratio - 16 / 9) < 0.01
 
-    def test_format_duration_short(self):
+    return make
+
+
+class TestVideoMetadata:
+    """Tests for VideoMetadata dataclass."""
+
+    def test_size_property(self, video_meta):
+        """Size should return (width, height) tuple."""
+        assert video_meta().size == (1920, 1080)
+
+    def test_aspect_ratio(self, video_meta):
+        """Aspect ratio should be calculated correctly."""
+        assert abs(video_meta().aspect_ratio - 16 / 9) < 0.01
+
+    def test_format_duration_short(self, video_meta):
         """Short durations should format as MM:SS."""
-        meta = VideoMetadata(
-            path=Path("test.mp4"),
-            duration=125.0,
-            fps=30.0,
-            width=1920,
-            height=1080,
-            has_audio=True,
-        )
-        assert meta.format_duration() == "2:05"
+        assert video_meta(125.0).format_duration() == "2:05"
 
-    def test_format_duration_long(self):
+    def test_format_duration_long(self, video_meta):
         """Long durations should format as HH:MM:SS."""
-        meta = VideoMetadata(
-            path=Path("test.mp4"),
-            duration=3725.0,
-            fps=30.0,
-            width=1920,
-            height=1080,
-            has_audio=True,
-        )
-        assert meta.format_duration() == "1:02:05"
+        assert video_meta(3725.0).format_duration() == "1:02:05"
 
 
 class TestAudioMetadata:
     """Tests for AudioMetadata dataclass."""
 
-    def test_format_duration(self):
+    def test_format_duration(self, audio_meta):
         """Duration should format correctly."""
-        meta = AudioMetadata(
-            path=Path("test.mp3"),
-            duration=185.0,
-            sample_rate=44100,
-            channels=2,
-        )
-        assert meta.format_duration() == "3:05"
+        assert audio_meta(185.0).format_duration() == "3:05"
 
-    def test_frozen(self):
+    def test_frozen(self, audio_meta):
         """AudioMetadata should be immutable."""
-        meta = AudioMetadata(
-            path=Path("test.mp3"),
-            duration=60.0,
-            sample_rate=44100,
-            channels=2,
-        )
+        meta = audio_meta()
         with pytest.raises(Exception):
             meta.duration = 120.0
@@ -0,0 +1,204 @@
+"""Tests for batch processing."""
+
+from pathlib import Path
+
+from ytdl_app.project import BatchProcessor, ProjectConfig
+from ytdl_app.project.batch import BatchJob, JobStatus
+
+
+def _copy_processor(input_path: Path, output_path: Path, config: ProjectConfig) -> None:
+    """Processor that copies the input file to the output path."""
+    output_path.write_bytes(input_path.read_bytes())
+
+
+def _failing_processor(input_path: Path, output_path: Path, config: ProjectConfig) -> None:
+    """Processor that fails for files named 'bad'."""
+    if input_path.stem == "bad":
+        raise RuntimeError("bad input")
+
+
+def _threads_processor(input_path: Path, output_path: Path, config: ProjectConfig) -> None:
+    """Processor that writes its ffmpeg thread share to the output path."""
+    output_path.write_text(str(config.metadata["ffmpeg_threads"]))
+
+
+def _copy_batch_processor(
+    input_paths: list[Path], output_paths: list[Path], config: ProjectConfig
+) -> None:
+    """Batch processor that copies each input file, failing on files named 'bad'."""
+    if any(path.stem == "bad" for path in input_paths):
+        raise RuntimeError("bad group")
+    for input_path, output_path in zip(input_paths, output_paths):
+        output_path.write_bytes(input_path.read_bytes())
+
+
+class TestBatchProcessor:
+    """Tests for BatchProcessor class."""
+
+    def _make_inputs(self, directory: Path, names: list[str]) -> list[Path]:
+        paths = []
+        for name in names:
+            path = directory / f"{name}.mp4"
+            path.write_bytes(name.encode())
+            paths.append(path)
+        return paths
+
+    def test_process_parallel(self, temp_dir):
+        """All jobs should complete when run in parallel."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        inputs = self._make_inputs(temp_dir, ["a", "b", "c", "d"])
+        batch.add_files(inputs, temp_dir / "out", suffix="_done")
+
+        summary = batch.process(_copy_processor, max_workers=4)
+
+        assert summary == {"completed": 4, "failed": 0, "total": 4}
+        assert (temp_dir / "out" / "c_done.mp4").read_bytes() == b"c"
+
+    def test_process_with_processes(self, temp_dir):
+        """Jobs should also run in a process pool."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b"]), temp_dir / "out")
+
+        summary = batch.process(_copy_processor, max_workers=2, use_processes=True)
+
+        assert summary["completed"] == 2
+
+    def test_process_records_failures(self, temp_dir):
+        """Failed jobs should be marked with their error."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["good", "bad"]), temp_dir / "out")
+
+        summary = batch.process(_failing_processor, max_workers=2)
+
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
+        assert batch.get_failed()[0].error == "bad input"
+
+    def test_process_skips_cancelled(self, temp_dir):
+        """Cancelled jobs should not be processed."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b"]), temp_dir / "out")
+        batch.cancel_all()
+
+        summary = batch.process(_copy_processor)
+
+        assert summary["completed"] == 0
+        assert all(job.status == JobStatus.CANCELLED for job in batch.jobs)
+
+    def test_cancel_during_process(self, temp_dir):
+        """Cancelling from the progress callback should stop jobs not yet started."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b", "c"]), temp_dir / "out")
+        events = []
+
+        def on_progress(job):
+            events.append((job.input_file.stem, job.status))
+            if job.status == JobStatus.COMPLETED:
+                batch.cancel_all()
+
+        batch.set_progress_callback(on_progress)
+        summary = batch.process(_copy_processor, max_workers=1)
+
+        assert summary == {"completed": 1, "failed": 0, "total": 3}
+        assert events == [("a", JobStatus.RUNNING), ("a", JobStatus.COMPLETED)]
+        assert [job.status for job in batch.jobs[1:]] == [JobStatus.CANCELLED] * 2
+        assert not (temp_dir / "out" / "b.mp4").exists()
+
+    def test_process_splits_threads(self, temp_dir):
+        """Each job should get an equal share of the ffmpeg thread budget."""
+        project = ProjectConfig(name="Test", metadata={"ffmpeg_threads": 8})
+        batch = BatchProcessor(project=project)
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b"]), temp_dir / "out")
+
+        batch.process(_threads_processor, max_workers=4)
+
+        # Only two jobs run at once, so each gets half the budget
+        assert (temp_dir / "out" / "a.mp4").read_text() == "4"
+        assert project.metadata == {"ffmpeg_threads": 8}
+
+    def test_process_splits_threads_by_pool(self, temp_dir):
+        """With more jobs than workers, the budget should be split by pool size."""
+        project = ProjectConfig(name="Test", metadata={"ffmpeg_threads": 8})
+        batch = BatchProcessor(project=project)
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b", "c"]), temp_dir / "out")
+
+        batch.process(_threads_processor, max_workers=2)
+
+        assert (temp_dir / "out" / "c.mp4").read_text() == "4"
+
+    def test_process_batched(self, temp_dir):
+        """Jobs should be processed in groups that succeed or fail together."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        inputs = self._make_inputs(temp_dir, ["a", "b", "bad", "c", "d"])
+        batch.add_files(inputs, temp_dir / "out")
+        batch.jobs[-1].status = JobStatus.CANCELLED
+
+        summary = batch.process_batched(_copy_batch_processor, group_size=2)
+
+        assert summary == {"completed": 2, "failed": 2, "total": 5}
+        assert (temp_dir / "out" / "b.mp4").read_bytes() == b"b"
+        assert [job.input_file.stem for job in batch.get_failed()] == ["bad", "c"]
+        assert batch.jobs[-1].status == JobStatus.CANCELLED
+
+    def test_cancel_during_process_batched(self, temp_dir):
+        """Cancelling after a group should skip the remaining groups."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b", "c"]), temp_dir / "out")
+
+        def on_progress(job):
+            if job.status == JobStatus.COMPLETED:
+                batch.cancel_all()
+
+        batch.set_progress_callback(on_progress)
+        summary = batch.process_batched(_copy_batch_processor, group_size=2)
+
+        assert summary == {"completed": 2, "failed": 0, "total": 3}
+        assert batch.jobs[-1].status == JobStatus.CANCELLED
+
+    def test_progress_callback(self, temp_dir):
+        """Progress callback should fire on start and completion of each job."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b"]), temp_dir / "out")
+        events = []
+        batch.set_progress_callback(lambda job: events.append(job.status))
+
+        batch.process(_copy_processor, max_workers=2)
+
+        assert events.count(JobStatus.RUNNING) == 2
+        assert events.count(JobStatus.COMPLETED) == 2
+
+    def test_status_filters(self, temp_dir):
+        """Status filters should return matching jobs."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a", "b", "c"]), temp_dir / "out")
+        batch.jobs[1].status = JobStatus.COMPLETED
+
+        assert len(batch.jobs) == 3
+        assert [job.input_file.stem for job in batch.get_pending()] == ["a", "c"]
+        assert batch.get_completed()[0].input_file.stem == "b"
+
+        batch.cancel_all()
+        assert batch.get_pending() == []
+        assert batch.jobs[-1].status == JobStatus.CANCELLED
+        assert batch.jobs[1].status == JobStatus.COMPLETED
+
+    def test_clear(self, temp_dir):
+        """Clear should remove all jobs."""
+        batch = BatchProcessor(project=ProjectConfig(name="Test"))
+        batch.add_files(self._make_inputs(temp_dir, ["a"]), temp_dir / "out")
+        batch.clear()
+
+        assert len(batch.jobs) == 0
+        assert batch.jobs == []
+
+    def test_jobs_list(self, temp_dir):
+        """Jobs can be passed in and mutated through the jobs list."""
+        job = BatchJob(input_file=temp_dir / "a.mp4", output_file=temp_dir / "out.mp4")
+        batch = BatchProcessor(project=ProjectConfig(name="Test"), jobs=[job])
+        batch.jobs.append(
+            BatchJob(input_file=temp_dir / "b.mp4", output_file=temp_dir / "b_out.mp4")
+        )
+
+        assert len(batch.jobs) == 2
+        assert batch.jobs[0] is job
+        assert batch.get_pending() == batch.jobs
@@ -1,34 +1,38 @@
 """Tests for edit history (undo/redo)."""
 
+import pytest
+
 from ytdl_app.project import EditHistory
 
 
+@pytest.fixture
+def history():
+    """Empty string history with the default size limit."""
+    return EditHistory[str]()
+
+
 class TestEditHistory:
     """Tests for EditHistory class."""
 
-    def test_push_and_undo(self):
+    def test_push_and_undo(self, history):
         """Push should allow undo to previous state."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         history.push("state2", "Edit 1")
 
         result = history.undo()
         assert result == "state1"
 
-    def test_undo_empty(self):
+    def test_undo_empty(self, history):
         """Undo on empty history should return None."""
-        history = EditHistory[str]()
         assert history.undo() is None
 
-    def test_undo_single(self):
+    def test_undo_single(self, history):
         """Undo with single state should return None."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         assert history.undo() is None
 
-    def test_redo(self):
+    def test_redo(self, history):
         """Redo should restore undone state."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         history.push("state2", "Edit 1")
 
@@ -37,15 +41,13 @@ class TestEditHistory:
 
         assert result == "state2"
 
-    def test_redo_empty(self):
+    def test_redo_empty(self, history):
         """Redo without undo should return None."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         assert history.redo() is None
 
-    def test_new_push_clears_redo(self):
+    def test_new_push_clears_redo(self, history):
         """New push after undo should clear redo stack."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         history.push("state2", "Edit 1")
         history.undo()
@@ -53,9 +55,8 @@ class TestEditHistory:
 
         assert history.redo() is None
 
-    def test_can_undo(self):
+    def test_can_undo(self, history):
         """Can undo should report correctly."""
-        history = EditHistory[str]()
         assert not history.can_undo()
 
         history.push("state1", "Initial")
@@ -64,9 +65,8 @@ class TestEditHistory:
         history.push("state2", "Edit")
         assert history.can_undo()
 
-    def test_can_redo(self):
+    def test_can_redo(self, history):
         """Can redo should report correctly."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         history.push("state2", "Edit")
 
@@ -79,13 +79,12 @@ class TestEditHistory:
         history = EditHistory[int](max_history=3)
 
         for i in range(5):
-            history.push(i, f"State {i}")
+            history.push(i)
 
         assert history.undo_count == 2  # max_history - 1
 
-    def test_descriptions(self):
+    def test_descriptions(self, history):
         """Descriptions should be retrievable."""
-        history = EditHistory[str]()
         history.push("state1", "First edit")
         history.push("state2", "Second edit")
 
@@ -93,9 +92,8 @@ class TestEditHistory:
         history.undo()
         assert history.get_redo_description() == "Second edit"
 
-    def test_clear(self):
+    def test_clear(self, history):
         """Clear should empty both stacks."""
-        history = EditHistory[str]()
         history.push("state1", "Initial")
         history.push("state2", "Edit")
         history.undo()
@@ -62,9 +62,11 @@ class TestProjectManager:
 
         manager.new_project("Project 2")
         manager.save(temp_dir / "p2.yaml")
+        (temp_dir / "notes.txt").write_text("not a project")
+        (temp_dir / "folder.json").mkdir()
 
         projects = ProjectManager.list_projects(temp_dir)
-        assert len(projects) == 2
+        assert projects == [temp_dir / "p1.json", temp_dir / "p2.yaml"]
 
 
 class TestProjectConfig:
@@ -97,3 +99,21 @@ class TestProjectConfig:
         assert restored.name == config.name
         assert len(restored.source_files) == 1
         assert restored.metadata["quality"] == "high"
+
+    def test_operation_dict_cached(self):
+        """Cached serialization should not leak into returned dicts."""
+        from datetime import datetime
+
+        from ytdl_app.project import EditOperation, OperationType
+
+        op = EditOperation(OperationType.SPEED, {"factor": 2.0})
+        first = op.to_dict()
+        first["type"] = "trim"
+
+        assert op.to_dict()["type"] == "speed"
+
+        op.params = {"factor": 0.5}
+        assert op.to_dict()["params"] == {"factor": 0.5}
+
+        op.timestamp = datetime(2024, 1, 1)
+        assert op.to_dict()["timestamp"] == "2024-01-01T00:00:00"
@@ -0,0 +1,82 @@
+"""Tests for the source clip pool."""
+
+from unittest.mock import MagicMock, patch
+
+from ytdl_app.video.clip_pool import ClipPool
+
+
+class TestClipPool:
+    """Tests for ClipPool class."""
+
+    def test_reuse_same_key(self):
+        """A clip put back should be returned for the same key."""
+        pool = ClipPool()
+        clip = MagicMock()
+        key = ("test.mp4", 1, 100)
+
+        pool.put(key, clip)
+
+        assert pool.take(key) is clip
+        assert pool.take(key) is None
+        clip.close.assert_not_called()
+
+    def test_changed_file_misses(self):
+        """A modified file should not reuse the old clip."""
+        pool = ClipPool()
+        pool.put(("test.mp4", 1, 100), MagicMock())
+
+        assert pool.take(("test.mp4", 2, 100)) is None
+
+    def test_eviction_closes_oldest(self):
+        """Clips beyond max_idle should be closed."""
+        pool = ClipPool(max_idle=1)
+        old, new = MagicMock(), MagicMock()
+
+        pool.put(("a.mp4", 1, 1), old)
+        pool.put(("b.mp4", 1, 1), new)
+
+        old.close.assert_called_once()
+        new.close.assert_not_called()
+
+    def test_missing_file_not_pooled(self, temp_dir):
+        """Clips without a pool key should be closed immediately."""
+        pool = ClipPool()
+        clip = MagicMock()
+        key = ClipPool.key_for(temp_dir / "missing.mp4")
+
+        pool.put(key, clip)
+
+        assert key is None
+        clip.close.assert_called_once()
+
+    def test_clear_closes_pooled_clip(self, temp_dir):
+        """Clear should close clips pooled under a real file's key."""
+        video_file = temp_dir / "video.mp4"
+        video_file.write_bytes(b"video")
+        pool = ClipPool()
+        clip = MagicMock()
+        key = ClipPool.key_for(video_file)
+
+        pool.put(key, clip)
+        pool.clear()
+
+        clip.close.assert_called_once()
+        assert pool.take(key) is None
+
+    @patch("ytdl_app.video.clip_pool.time.monotonic")
+    def test_idle_clips_expire(self, mock_monotonic):
+        """Clips idle for longer than idle_timeout should be closed."""
+        pool = ClipPool(idle_timeout=60.0)
+        old, recent = MagicMock(), MagicMock()
+
+        mock_monotonic.return_value = 0.0
+        pool.put(("a.mp4", 1, 1), old)
+        mock_monotonic.return_value = 50.0
+        pool.put(("b.mp4", 1, 1), recent)
+        mock_monotonic.return_value = 70.0
+        pool.close_expired()
+
+        old.close.assert_called_once()
+        recent.close.assert_not_called()
+        assert pool.take(("b.mp4", 1, 1)) is recent
+        pool.clear()
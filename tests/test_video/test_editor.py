@@ -1,30 +1,34 @@
 """Tests for video editor with mocked moviepy."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+import pytest
+
+from ytdl_app.models import HWAccelConfig
 from ytdl_app.video import VideoEditor
 
+TEST_MP4 = Path("test.mp4")
+
 
+@patch("ytdl_app.video.editor.VideoFileClip")
 class TestVideoEditor:
     """Tests for VideoEditor class with mocked moviepy."""
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
     def test_context_manager(self, mock_clip_class, mock_video_clip):
         """Editor should work as context manager."""
         mock_clip_class.return_value = mock_video_clip
 
-        with VideoEditor(Path("test.mp4")) as editor:
+        with VideoEditor(TEST_MP4) as editor:
             assert editor.clip is not None
 
         mock_video_clip.close.assert_called_once()
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
     def test_get_metadata(self, mock_clip_class, mock_video_clip):
         """Get metadata should return correct values."""
         mock_clip_class.return_value = mock_video_clip
 
-        with VideoEditor(Path("test.mp4")) as editor:
+        with VideoEditor(TEST_MP4) as editor:
             meta = editor.get_metadata()
 
         assert meta.duration == 10.0
@@ -32,62 +36,228 @@ class TestVideoEditor:
         assert meta.width == 1920
         assert meta.height == 1080
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_trim(self, mock_clip_class, mock_video_clip):
-        """Trim should call subclipped on clip."""
+    @pytest.mark.parametrize(
+        ("method", "args", "clip_method", "expected"),
+        [
+            pytest.param("trim", (5.0, 10.0), "subclipped", call(5.0, 10.0), id="trim"),
+            pytest.param(
+                "adjust_volume", (0.5,), "with_volume_scaled", call(0.5), id="adjust_volume"
+            ),
+            pytest.param("speed", (2.0,), "with_speed_scaled", call(2.0), id="speed"),
+            pytest.param("reverse", (), "time_mirror", call(), id="reverse"),
+            pytest.param("loop", (3,), "loop", call(n=3), id="loop"),
+        ],
+    )
+    def test_clip_edit(self, mock_clip_class, method, args, clip_method, expected, mock_video_clip):
+        """Each edit should make a single call to the matching clip method."""
         mock_clip_class.return_value = mock_video_clip
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            editor.trim(5.0, 10.0)
+        with VideoEditor(TEST_MP4) as editor:
+            getattr(editor, method)(*args)
 
-        mock_video_clip.subclipped.assert_called_with(5.0, 10.0)
+        assert getattr(mock_video_clip, clip_method).call_args_list == [expected]
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_adjust_volume(self, mock_clip_class, mock_video_clip):
-        """Adjust volume should scale audio."""
+    def test_method_chaining(self, mock_clip_class, mock_video_clip):
+        """Methods should support chaining."""
         mock_clip_class.return_value = mock_video_clip
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            editor.adjust_volume(0.5)
+        with VideoEditor(TEST_MP4) as editor:
+            result = editor.trim(0, 5).speed(2.0).reverse()
 
-        mock_video_clip.with_volume_scaled.assert_called_with(0.5)
+        assert result is editor
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_speed(self, mock_clip_class, mock_video_clip):
-        """Speed should call with_speed_scaled."""
+    @patch("ytdl_app.video.editor.effective_cpu_count", return_value=8)
+    def test_export_threads(self, _, mock_clip_class, mock_video_clip, temp_dir):
+        """Export should use all cores unless a thread count is given."""
         mock_clip_class.return_value = mock_video_clip
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            editor.speed(2.0)
+        with VideoEditor(TEST_MP4) as editor:
+            editor.export(temp_dir / "out.mp4")
+            assert mock_video_clip.write_videofile.call_args.kwargs["threads"] == 8
 
-        mock_video_clip.with_speed_scaled.assert_called_with(2.0)
+            editor.export(temp_dir / "out.mp4", threads=2)
+            assert mock_video_clip.write_videofile.call_args.kwargs["threads"] == 2
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_reverse(self, mock_clip_class, mock_video_clip):
-        """Reverse should call time_mirror."""
+    @patch("ytdl_app.video.ffmpeg.is_encoder_available", return_value=True)
+    def test_export_hwaccel(self, _, mock_clip_class, mock_video_clip, temp_dir):
+        """Export should use NVENC when hardware encoding is enabled."""
         mock_clip_class.return_value = mock_video_clip
+        hwaccel = HWAccelConfig(use_hwaccel=True)
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            editor.reverse()
+        with VideoEditor(TEST_MP4, hwaccel) as editor:
+            editor.export(temp_dir / "out.mp4")
 
-        mock_video_clip.time_mirror.assert_called_once()
+        kwargs = mock_video_clip.write_videofile.call_args.kwargs
+        assert kwargs["codec"] == "h264_nvenc"
+        assert kwargs["preset"] == "p4"
+        assert kwargs["ffmpeg_params"] == ["-rc", "vbr", "-cq", "23"]
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_loop(self, mock_clip_class, mock_video_clip):
-        """Loop should call loop with n parameter."""
+    @patch("ytdl_app.video.ffmpeg.is_encoder_available", return_value=False)
+    def test_export_hwaccel_fallback(self, _, mock_clip_class, mock_video_clip, temp_dir):
+        """Export should fall back to libx264 when NVENC is unavailable."""
         mock_clip_class.return_value = mock_video_clip
+        hwaccel = HWAccelConfig(use_hwaccel=True)
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            editor.loop(3)
+        with VideoEditor(TEST_MP4, hwaccel) as editor:
+            editor.export(temp_dir / "out.mp4")
 
-        mock_video_clip.loop.assert_called_with(n=3)
+        kwargs = mock_video_clip.write_videofile.call_args.kwargs
+        assert kwargs["codec"] == "libx264"
+        assert "ffmpeg_params" not in kwargs
 
-    @patch("ytdl_app.video.editor.VideoFileClip")
-    def test_method_chaining(self, mock_clip_class, mock_video_clip):
-        """Methods should support chaining."""
+    @patch("ytdl_app.video.editor.trim_stream_copy")
+    def test_trim_copy_export(self, mock_copy, mock_clip_class, mock_video_clip):
+        """Stream-copy trim should bypass re-encoding on export."""
         mock_clip_class.return_value = mock_video_clip
+        mock_video_clip.subclipped.return_value = mock_video_clip.copy()
 
-        with VideoEditor(Path("test.mp4")) as editor:
-            result = editor.trim(0, 5).speed(2.0).reverse()
+        with VideoEditor(TEST_MP4) as editor:
+            editor.trim(2.0, 8.0, copy=True).export(Path("out.mp4"))
 
-        assert result is editor
+        mock_copy.assert_called_once_with(TEST_MP4, Path("out.mp4"), 2.0, 8.0)
+        mock_video_clip.write_videofile.assert_not_called()
+
+    @patch("ytdl_app.video.editor.subprocess.run")
+    @patch("ytdl_app.video.editor.trim_stream_copy")
+    def test_trim_copy_dropped_after_edit(
+        self, mock_copy, mock_run, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """Further edits after a stream-copy trim should force re-encoding."""
+        mock_clip_class.return_value = mock_video_clip
+        trimmed = mock_video_clip.copy()
+        trimmed.with_speed_scaled.return_value.size = (1920, 1080)
+        mock_video_clip.subclipped.return_value = trimmed
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.trim(2.0, 8.0, copy=True).speed(2.0).export(temp_dir / "out.mp4")
+
+        mock_copy.assert_not_called()
+        mock_run.assert_called_once()
+
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_filter_chain(self, mock_run, mock_clip_class, mock_video_clip, temp_dir):
+        """Chained native operations should export in one ffmpeg pass."""
+        mock_clip_class.return_value = mock_video_clip
+        mock_video_clip.subclipped.return_value = mock_video_clip
+        mock_video_clip.with_speed_scaled.return_value = mock_video_clip
+        mock_video_clip.resized.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.trim(1.0, 5.0).speed(0.25).resize(width=640).export(temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-ss") : cmd.index("-i")] == ["-ss", "1.0", "-to", "5.0"]
+        assert cmd[cmd.index("-vf") + 1] == "setpts=PTS/0.25,scale=640:-2"
+        assert cmd[cmd.index("-af") + 1] == "atempo=0.5,atempo=0.5"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "yuv420p"
+        mock_video_clip.write_videofile.assert_not_called()
+
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_later_trim_filtered(
+        self, mock_run, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """A trim after another operation should stay in the filter chain."""
+        mock_clip_class.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.speed(2.0).trim(1.0, 2.0).export(temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        assert "-ss" not in cmd
+        assert cmd[cmd.index("-vf") + 1] == (
+            "setpts=PTS/2.0,trim=start=1.0:end=2.0,setpts=PTS-STARTPTS"
+        )
+
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_odd_size_keeps_pix_fmt(
+        self, mock_run, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """Odd output sizes cannot be 4:2:0, so the source pixel format is kept."""
+        mock_clip_class.return_value = mock_video_clip
+        cropped = mock_video_clip.copy()
+        cropped.size = (321, 240)
+        mock_video_clip.cropped.return_value = cropped
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.crop(0, 0, 321, 240).export(temp_dir / "out.mp4")
+
+        assert "-pix_fmt" not in mock_run.call_args.args[0]
+
+    @patch("ytdl_app.video.ffmpeg.get_available_hwaccels", return_value=frozenset({"cuda"}))
+    @patch("ytdl_app.video.ffmpeg.is_encoder_available", return_value=True)
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_filter_chain_hwaccel(
+        self, mock_run, _, __, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """Native exports should decode and encode on the GPU when enabled."""
+        mock_clip_class.return_value = mock_video_clip
+        mock_video_clip.subclipped.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4, HWAccelConfig(use_hwaccel=True)) as editor:
+            editor.trim(1.0, 5.0).export(temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-hwaccel") + 1] == "cuda"
+        assert cmd.index("-hwaccel") < cmd.index("-i")
+        assert cmd[cmd.index("-c:v") + 1] == "h264_nvenc"
+
+    @patch("ytdl_app.video.ffmpeg.get_available_hwaccels", return_value=frozenset({"cuda"}))
+    @patch("ytdl_app.video.ffmpeg.is_encoder_available", return_value=True)
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_gpu_resident_scale(
+        self, mock_run, _, __, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """Scaling between NVDEC and NVENC should stay in GPU memory."""
+        mock_clip_class.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4, HWAccelConfig(use_hwaccel=True)) as editor:
+            editor.trim(1.0, 5.0).resize(width=640).export(temp_dir / "out.mp4")
+            cmd = mock_run.call_args.args[0]
+            assert cmd[cmd.index("-hwaccel_output_format") + 1] == "cuda"
+            assert cmd[cmd.index("-vf") + 1] == "scale_cuda=640:-2,scale_cuda=format=yuv420p"
+            assert "-pix_fmt" not in cmd
+
+            editor.crop(0, 0, 320, 240).export(temp_dir / "out.mp4")
+            cmd = mock_run.call_args.args[0]
+            assert "-hwaccel_output_format" not in cmd
+            assert "crop=320:240:0:0" in cmd[cmd.index("-vf") + 1]
+
+    @patch("ytdl_app.video.editor.subprocess.run")
+    def test_export_moviepy_fallback(self, mock_run, mock_clip_class, mock_video_clip, temp_dir):
+        """Operations without an ffmpeg equivalent should export through moviepy."""
+        mock_clip_class.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.resize(width=640).rotate(45).export(temp_dir / "out.mp4")
+
+        mock_run.assert_not_called()
+        assert mock_video_clip.write_videofile.called
+
+    @patch("ytdl_app.video.editor.run_frame_pipeline")
+    @patch("ytdl_app.video.editor.FFMPEG_VideoWriter")
+    def test_export_pipelined(
+        self, mock_writer, mock_pipeline, mock_clip_class, mock_video_clip, temp_dir
+    ):
+        """Pipelined export should hand trailing effects to the worker pool."""
+        mock_clip_class.return_value = mock_video_clip
+        mock_video_clip.audio = None
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.grayscale().sepia().export_pipelined(temp_dir / "out.mp4", workers=3)
+
+        frames, ops, write = mock_pipeline.call_args.args
+        assert len(ops) == 2
+        assert mock_pipeline.call_args.kwargs["workers"] == 3
+        assert mock_writer.call_args.args[1:] == ((1920, 1080), 30.0)
+
+    def test_effects_fused(self, mock_clip_class, mock_video_clip, temp_dir):
+        """Chained effects should be applied in a single image transform."""
+        mock_clip_class.return_value = mock_video_clip
+
+        with VideoEditor(TEST_MP4) as editor:
+            editor.grayscale().sepia().blur(3)
+            mock_video_clip.image_transform.assert_not_called()
+
+            editor.export(temp_dir / "out.mp4")
+
+        mock_video_clip.image_transform.assert_called_once()
@@ -0,0 +1,116 @@
+"""Tests for video effects."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from ytdl_app.video.effects import (
+    ColorGrading,
+    apply_blur,
+    apply_color_grading,
+    apply_edge_detection,
+    apply_grayscale,
+    apply_invert,
+    apply_sepia,
+    fuse_ops,
+    grayscale_op,
+)
+
+
+def _frame_function(effect, *args):
+    """Get the per-frame function an effect registers on a clip."""
+    clip = MagicMock()
+    effect(clip, *args)
+    return clip.image_transform.call_args.args[0]
+
+
+class TestFrameEffects:
+    """Tests for per-frame color effects."""
+
+    def test_grayscale(self):
+        """Grayscale should copy the luma value to every channel."""
+        frame = np.array([[[255, 0, 0], [0, 0, 255]]], dtype=np.uint8)
+
+        result = _frame_function(apply_grayscale)(frame)
+
+        assert result.dtype == np.uint8
+        assert result.tolist() == [[[76, 76, 76], [29, 29, 29]]]
+
+    def test_invert_leaves_input(self):
+        """Invert should flip every bit without modifying the source frame."""
+        frame = np.array([[[0, 128, 255]]], dtype=np.uint8)
+
+        result = _frame_function(apply_invert)(frame)
+
+        assert result.tolist() == [[[255, 127, 0]]]
+        assert frame.tolist() == [[[0, 128, 255]]]
+
+    def test_sepia_clips(self):
+        """Sepia should clip bright pixels to 255."""
+        frame = np.full((2, 2, 3), 255, dtype=np.uint8)
+
+        result = _frame_function(apply_sepia)(frame)
+
+        assert result.dtype == np.uint8
+        assert result[0, 0].tolist() == [255, 255, 238]
+
+    def test_desaturate(self):
+        """Zero saturation should produce equal channels."""
+        frame = np.array([[[200, 100, 50]]], dtype=np.uint8)
+
+        result = _frame_function(apply_color_grading, ColorGrading(saturation=0.0))(frame)
+
+        assert len(set(result[0, 0].tolist())) == 1
+
+    def test_contrast_pivots_on_mean(self):
+        """Contrast should stretch levels away from the sampled frame mean."""
+        frame = np.full((16, 16, 3), 100, dtype=np.uint8)
+        frame[:, 8:] = 200
+
+        result = _frame_function(apply_color_grading, ColorGrading(contrast=2.0))(frame)
+
+        assert sorted(np.unique(result).tolist()) == [50, 250]
+
+    def test_blur_flat_frame(self):
+        """Blurring a flat frame should leave it unchanged."""
+        frame = np.full((6, 6, 3), 90, dtype=np.uint8)
+
+        result = _frame_function(apply_blur, 3)(frame)
+
+        assert result.dtype == np.uint8
+        assert np.array_equal(result, frame)
+
+    def test_edge_detection_scaled(self):
+        """Edge magnitudes should be scaled so the strongest edge is 255."""
+        frame = np.zeros((6, 6, 3), dtype=np.uint8)
+        frame[:, 3:] = 255
+
+        result = _frame_function(apply_edge_detection)(frame)
+
+        assert result.shape == (6, 6, 3)
+        assert result.max() == 255
+        assert result[:, 0].max() == 0
+
+    def test_edge_detection_flat_frame(self):
+        """A frame without edges should come out black rather than NaN."""
+        frame = np.full((4, 4, 3), 128, dtype=np.uint8)
+
+        result = _frame_function(apply_edge_detection)(frame)
+
+        assert result.max() == 0
+
+
+class TestFuseOps:
+    """Tests for fuse_ops."""
+
+    def test_applies_in_order(self):
+        """Fused operations should run in the order given."""
+        fused = fuse_ops([lambda f: f + 1, lambda f: f * 2])
+
+        assert fused(np.array([3])).tolist() == [8]
+
+    def test_single_op_unwrapped(self):
+        """A single operation should be returned as is."""
+        op = grayscale_op()
+
+        assert fuse_ops([op]) is op
@@ -0,0 +1,60 @@
+"""Tests for ffmpeg capability probing."""
+
+import os
+from unittest.mock import patch
+
+from ytdl_app.video.ffmpeg import (
+    cuda_filter_chain,
+    effective_cpu_count,
+    get_available_hwaccels,
+)
+
+# Bypass the cache so each test sees its own environment
+_effective_cpu_count = effective_cpu_count.__wrapped__
+
+
+class TestGetAvailableHwaccels:
+    """Tests for get_available_hwaccels."""
+
+    @patch("ytdl_app.video.ffmpeg.subprocess.run")
+    def test_parses_methods(self, mock_run):
+        """Methods listed after the header line should be returned."""
+        mock_run.return_value.stdout = "Hardware acceleration methods:\ncuda\nvaapi\n\n"
+
+        assert get_available_hwaccels.__wrapped__() == frozenset({"cuda", "vaapi"})
+
+
+class TestCudaFilterChain:
+    """Tests for cuda_filter_chain."""
+
+    def test_translates_scale(self):
+        """Retiming filters pass through and scale maps to scale_cuda."""
+        chain = cuda_filter_chain(["trim=start=1:end=2", "setpts=PTS-STARTPTS", "scale=640:-2"])
+
+        assert chain == ["trim=start=1:end=2", "setpts=PTS-STARTPTS", "scale_cuda=640:-2"]
+
+    def test_converts_pix_fmt(self):
+        """A pixel format should be converted on the GPU at the end of the chain."""
+        chain = cuda_filter_chain(["scale=640:-2"], "yuv420p")
+
+        assert chain == ["scale_cuda=640:-2", "scale_cuda=format=yuv420p"]
+
+    def test_unsupported_filter(self):
+        """Filters without a CUDA equivalent should rule out GPU-resident frames."""
+        assert cuda_filter_chain(["scale=640:-2", "hflip"]) is None
+
+
+class TestEffectiveCpuCount:
+    """Tests for effective_cpu_count."""
+
+    @patch("ytdl_app.video.ffmpeg.Path.read_text", return_value="200000 100000\n")
+    @patch.object(os, "sched_getaffinity", return_value=set(range(16)), create=True)
+    def test_cgroup_quota(self, _, __):
+        """A cgroup CPU quota should cap the count."""
+        assert _effective_cpu_count() == 2
+
+    @patch("ytdl_app.video.ffmpeg.Path.read_text", return_value="max 100000\n")
+    @patch.object(os, "sched_getaffinity", return_value={0, 1, 2}, create=True)
+    def test_affinity_without_quota(self, _, __):
+        """Without a quota the affinity mask should decide."""
+        assert _effective_cpu_count() == 3
@@ -0,0 +1,283 @@
+"""Tests for standalone video operations."""
+
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ytdl_app.models import VideoMetadata
+from ytdl_app.video import operations
+from ytdl_app.video.clip_pool import ClipPool
+from ytdl_app.video.operations import (
+    can_stream_copy,
+    concatenate_videos,
+    extract_frame_at,
+    filter_videos_batch,
+    get_video_info,
+)
+
+
+@pytest.fixture
+def video_file(temp_dir, monkeypatch):
+    """Create a placeholder video file with an isolated metadata cache."""
+    monkeypatch.setattr(operations, "METADATA_CACHE_DIR", temp_dir / "meta")
+    monkeypatch.setattr(operations, "get_ffprobe_binary", lambda: None)
+    path = temp_dir / "test.mp4"
+    path.write_bytes(b"\x00" * 16)
+    return path
+
+
+class TestGetVideoInfo:
+    """Tests for get_video_info metadata caching."""
+
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    def test_cached_after_first_probe(self, mock_clip_class, mock_video_clip, video_file):
+        """Second lookup should be served from the sidecar cache."""
+        mock_clip_class.return_value.__enter__.return_value = mock_video_clip
+
+        first = get_video_info(video_file)
+        second = get_video_info(video_file)
+
+        assert first == second
+        assert second.width == 1920
+        assert mock_clip_class.call_count == 1
+
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    def test_cache_invalidated_on_change(
+        self, mock_clip_class, mock_video_clip, video_file
+    ):
+        """Modifying the file should trigger a fresh probe."""
+        mock_clip_class.return_value.__enter__.return_value = mock_video_clip
+
+        get_video_info(video_file)
+        video_file.write_bytes(b"\x00" * 32)
+        os.utime(video_file, ns=(0, 0))
+        get_video_info(video_file)
+
+        assert mock_clip_class.call_count == 2
+
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    def test_memoized_in_process(self, mock_clip_class, mock_video_clip, video_file, temp_dir):
+        """Lookups should not depend on the sidecar cache within a process."""
+        mock_clip_class.return_value.__enter__.return_value = mock_video_clip
+
+        first = get_video_info(video_file)
+        shutil.rmtree(temp_dir / "meta")
+        second = get_video_info(video_file)
+
+        assert second == first
+        assert mock_clip_class.call_count == 1
+
+
+class TestProbeVideoHeader:
+    """Tests for the ffprobe header probe."""
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    def test_parses_header(self, mock_run, _, video_file):
+        """Header fields should map onto VideoMetadata."""
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(
+                {
+                    "streams": [
+                        {
+                            "codec_type": "video",
+                            "width": 1920,
+                            "height": 1080,
+                            "avg_frame_rate": "30000/1001",
+                        },
+                        {"codec_type": "audio"},
+                    ],
+                    "format": {"duration": "12.5"},
+                }
+            )
+        )
+
+        meta = get_video_info(video_file)
+
+        assert meta.size == (1920, 1080)
+        assert abs(meta.fps - 29.97) < 0.01
+        assert meta.duration == 12.5
+        assert meta.has_audio
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    def test_rotation_swaps_dimensions(self, mock_run, _, video_file):
+        """Portrait rotation metadata should swap width and height."""
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(
+                {
+                    "streams": [
+                        {
+                            "codec_type": "video",
+                            "width": 1920,
+                            "height": 1080,
+                            "avg_frame_rate": "30/1",
+                            "side_data_list": [{"rotation": -90}],
+                        }
+                    ],
+                    "format": {"duration": "5.0"},
+                }
+            )
+        )
+
+        meta = get_video_info(video_file)
+
+        assert meta.size == (1080, 1920)
+        assert not meta.has_audio
+
+
+class TestCanStreamCopy:
+    """Tests for keyframe-aligned stream copy detection."""
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    def test_aligned_start(self, mock_run, _):
+        """Start on a keyframe should allow stream copy."""
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"frames": [{"pts_time": "4.004000"}]})
+        )
+        assert can_stream_copy(Path("test.mp4"), 4.0)
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    def test_unaligned_start(self, mock_run, _):
+        """Start far from a keyframe should require re-encoding."""
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps({"frames": [{"pts_time": "2.000000"}]})
+        )
+        assert not can_stream_copy(Path("test.mp4"), 4.0)
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value=None)
+    def test_no_ffprobe(self, _):
+        """Missing ffprobe should disable stream copy."""
+        assert not can_stream_copy(Path("test.mp4"), 0.0)
+
+
+class TestFilterVideosBatch:
+    """Tests for filter_videos_batch."""
+
+    @patch("ytdl_app.video.operations.subprocess.run")
+    def test_single_invocation(self, mock_run, temp_dir):
+        """All files should be filtered by one ffmpeg command."""
+        outputs = [temp_dir / "out" / "a.mp4", temp_dir / "out" / "b.mp4"]
+
+        filter_videos_batch([Path("a.mp4"), Path("b.mp4")], outputs, "scale=1280:720")
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph == "[0:v]scale=1280:720[v0];[1:v]scale=1280:720[v1]"
+        assert cmd[-1] == str(outputs[1])
+        assert "1:a?" in cmd
+
+    def test_mismatched_outputs(self):
+        """Input and output lists must have the same length."""
+        with pytest.raises(ValueError):
+            filter_videos_batch([Path("a.mp4")], [], "scale=1280:720")
+
+
+class TestExtractFrameAt:
+    """Tests for extract_frame_at."""
+
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    def test_reuses_pooled_clip(self, mock_clip_class, mock_video_clip, video_file, monkeypatch):
+        """Repeated frame reads should reuse the same open clip."""
+        monkeypatch.setattr(operations, "clip_pool", ClipPool())
+        mock_clip_class.return_value = mock_video_clip
+
+        extract_frame_at(video_file, 1.0)
+        extract_frame_at(video_file, 2.0)
+
+        assert mock_clip_class.call_count == 1
+        mock_video_clip.get_frame.assert_called_with(2.0)
+
+
+class TestConcatenateVideos:
+    """Tests for concatenate_videos."""
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value=None)
+    @patch("ytdl_app.video.operations.subprocess.run")
+    @patch("ytdl_app.video.operations.get_video_info")
+    def test_native_concat(self, mock_info, mock_run, _, temp_dir):
+        """Matching inputs should be joined by one ffmpeg concat filter."""
+        mock_info.return_value = VideoMetadata(Path("a.mp4"), 10.0, 30.0, 1920, 1080, True)
+
+        concatenate_videos([Path("a.mp4"), Path("b.mp4")], temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph == "[0:v][0:a][1:v][1:a]concat=n=2:v=1:a=1[v][a]"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "yuv420p"
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value=None)
+    @patch("ytdl_app.video.operations.concatenate_videoclips")
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    @patch("ytdl_app.video.operations.get_video_info")
+    def test_mismatched_sizes_use_moviepy(
+        self, mock_info, mock_run, mock_clip_class, mock_concat, _, temp_dir
+    ):
+        """Inputs with different frame sizes should fall back to moviepy."""
+        mock_info.side_effect = [
+            VideoMetadata(Path("a.mp4"), 10.0, 30.0, 1920, 1080, True),
+            VideoMetadata(Path("b.mp4"), 10.0, 30.0, 1280, 720, True),
+        ]
+
+        concatenate_videos([Path("a.mp4"), Path("b.mp4")], temp_dir / "out.mp4")
+
+        mock_run.assert_not_called()
+        mock_concat.return_value.write_videofile.assert_called_once()
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value=None)
+    @patch("ytdl_app.video.operations.concatenate_videoclips")
+    @patch("ytdl_app.video.operations.VideoFileClip")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    @patch("ytdl_app.video.operations.get_video_info")
+    def test_rejected_native_concat_uses_moviepy(
+        self, mock_info, mock_run, mock_clip_class, mock_concat, _, temp_dir
+    ):
+        """Inputs the concat filter rejects should fall back to moviepy."""
+        mock_info.return_value = VideoMetadata(Path("a.mp4"), 10.0, 30.0, 1920, 1080, True)
+        mock_run.side_effect = subprocess.CalledProcessError(234, "ffmpeg")
+
+        concatenate_videos([Path("a.mp4"), Path("b.mp4")], temp_dir / "out.mp4")
+
+        mock_concat.return_value.write_videofile.assert_called_once()
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    @patch("ytdl_app.video.operations.get_video_info")
+    def test_stream_copy_concat(self, mock_info, mock_run, _, temp_dir):
+        """Inputs already in the target codec should be joined without re-encoding."""
+        streams = '{"streams": [{"codec_type": "video", "codec_name": "h264", "width": 640}]}'
+        mock_run.return_value = MagicMock(stdout=streams)
+
+        concatenate_videos([Path("a.mp4"), Path("b.mp4")], temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-f") + 1] == "concat"
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        mock_info.assert_not_called()
+
+    @patch("ytdl_app.video.operations.get_ffprobe_binary", return_value="ffprobe")
+    @patch("ytdl_app.video.operations.subprocess.run")
+    @patch("ytdl_app.video.operations.get_video_info")
+    def test_mismatched_headers_reencode(self, mock_info, mock_run, _, temp_dir):
+        """Inputs whose codec headers differ should not be stream copied."""
+        mock_info.return_value = VideoMetadata(Path("a.mp4"), 10.0, 30.0, 1920, 1080, False)
+        probes = [
+            {"streams": [{"codec_type": "video", "codec_name": "h264", "extradata_hash": h}]}
+            for h in ("MD5:aa", "MD5:bb")
+        ]
+        mock_run.side_effect = [MagicMock(stdout=json.dumps(p)) for p in probes] + [MagicMock()]
+
+        concatenate_videos([Path("a.mp4"), Path("b.mp4")], temp_dir / "out.mp4")
+
+        cmd = mock_run.call_args.args[0]
+        assert "-filter_complex" in cmd
+        assert "-show_data_hash" in mock_run.call_args_list[0].args[0]
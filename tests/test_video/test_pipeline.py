@@ -0,0 +1,46 @@
+"""Tests for the pipelined frame processing."""
+
+import numpy as np
+import pytest
+
+from ytdl_app.video.pipeline import run_frame_pipeline
+
+
+def _frames(n):
+    """Generate n tiny frames numbered by their pixel value."""
+    for i in range(n):
+        yield np.full((2, 2, 3), i, dtype=np.uint8)
+
+
+class TestRunFramePipeline:
+    """Tests for run_frame_pipeline."""
+
+    def test_preserves_order(self):
+        """Frames should be written in input order with every op applied."""
+        written = []
+
+        count = run_frame_pipeline(
+            _frames(50), [lambda f: f + 1, lambda f: f * 2], written.append, workers=4, queue_size=2
+        )
+
+        assert count == 50
+        assert [int(f[0, 0, 0]) for f in written] == [(i + 1) * 2 for i in range(50)]
+
+    def test_reader_error_raised(self):
+        """Decoding errors should surface in the caller."""
+
+        def failing_frames():
+            yield from _frames(3)
+            raise OSError("decode failed")
+
+        with pytest.raises(OSError, match="decode failed"):
+            run_frame_pipeline(failing_frames(), [], lambda f: None)
+
+    def test_writer_error_stops_reader(self):
+        """A failing writer should stop the pipeline without hanging."""
+
+        def write(frame):
+            raise BrokenPipeError
+
+        with pytest.raises(BrokenPipeError):
+            run_frame_pipeline(_frames(100), [], write, queue_size=2)
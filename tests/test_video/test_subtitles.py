@@ -0,0 +1,82 @@
+"""Tests for subtitle parsing."""
+
+from unittest.mock import patch
+
+import numpy as np
+from moviepy import ColorClip
+
+from ytdl_app.video import SubtitleEntry, add_subtitles, iter_srt, parse_srt
+
+SRT = """1
+00:00:01,500 --> 00:00:03,000
+Hello
+
+2
+01:02:03,250 --> 01:02:04,000
+Two
+lines
+"""
+
+
+class TestParseSrt:
+    """Tests for parse_srt."""
+
+    def test_parse_entries(self, temp_dir):
+        """Entries should have times in seconds and multi-line text."""
+        path = temp_dir / "subs.srt"
+        path.write_text(SRT, encoding="utf-8")
+
+        entries = parse_srt(path)
+
+        assert [(e.start_time, e.end_time, e.text) for e in entries] == [
+            (1.5, 3.0, "Hello"),
+            (3723.25, 3724.0, "Two\nlines"),
+        ]
+
+    def test_parse_crlf_with_bom(self, temp_dir):
+        """Windows line endings and a byte order mark should not affect parsing."""
+        path = temp_dir / "subs.srt"
+        path.write_bytes(b"\xef\xbb\xbf" + SRT.replace("\n", "\r\n").encode())
+
+        entries = parse_srt(path)
+
+        assert [e.text for e in entries] == ["Hello", "Two\nlines"]
+        assert entries[0].duration == 1.5
+
+    def test_empty_file(self, temp_dir):
+        """An empty file should parse to no entries."""
+        path = temp_dir / "subs.srt"
+        path.write_bytes(b"")
+
+        assert parse_srt(path) == []
+
+    def test_iter_srt_lazy(self, temp_dir):
+        """iter_srt should yield entries one at a time."""
+        path = temp_dir / "subs.srt"
+        path.write_text(SRT, encoding="utf-8")
+
+        entries = iter_srt(path)
+
+        assert next(entries).text == "Hello"
+        entries.close()
+
+
+class TestAddSubtitles:
+    """Tests for add_subtitles."""
+
+    @patch("ytdl_app.video.subtitles._rasterize")
+    def test_draws_active_entries(self, mock_rasterize):
+        """Each text should be rasterized once and drawn only while showing."""
+        mock_rasterize.return_value = (np.full((2, 4, 3), 255, dtype=np.uint8), None)
+        clip = ColorClip((8, 6), color=(0, 0, 0), duration=3)
+        subtitles = [
+            SubtitleEntry(0.0, 1.0, "Hi"),
+            SubtitleEntry(2.0, 2.5, "Hi"),
+        ]
+
+        result = add_subtitles(clip, subtitles)
+
+        mock_rasterize.assert_called_once()
+        assert result.get_frame(0.5)[4:6, 2:6].min() == 255
+        assert result.get_frame(1.5).max() == 0
+        assert result.get_frame(2.2)[4:6, 2:6].min() == 255
@@ -1,5 +1,8 @@
 """Tests for video transforms."""
 
+from unittest.mock import call
+
+import pytest
 
 from ytdl_app.video.transforms import (
     CropRegion,
@@ -36,43 +39,44 @@ class TestRotationAngle:
 class TestTransformFunctions:
     """Tests for transform functions."""
 
-    def test_apply_speed(self, mock_video_clip):
-        """Apply speed should call with_speed_scaled."""
-        apply_speed(mock_video_clip, 2.0)
-        mock_video_clip.with_speed_scaled.assert_called_with(2.0)
-
-    def test_apply_reverse(self, mock_video_clip):
-        """Apply reverse should call time_mirror."""
-        apply_reverse(mock_video_clip)
-        mock_video_clip.time_mirror.assert_called_once()
-
-    def test_apply_loop(self, mock_video_clip):
-        """Apply loop should call loop with n."""
-        apply_loop(mock_video_clip, 3)
-        mock_video_clip.loop.assert_called_with(n=3)
-
-    def test_apply_crop(self, mock_video_clip):
-        """Apply crop should call cropped with region."""
-        region = CropRegion(0, 0, 100, 100)
-        apply_crop(mock_video_clip, region)
-        mock_video_clip.cropped.assert_called_with(x1=0, y1=0, x2=100, y2=100)
-
-    def test_apply_resize_width_only(self, mock_video_clip):
-        """Resize with width only should maintain aspect ratio."""
-        apply_resize(mock_video_clip, width=1280)
-        mock_video_clip.resized.assert_called_with(width=1280)
-
-    def test_apply_resize_both(self, mock_video_clip):
-        """Resize with both dimensions should use tuple."""
-        apply_resize(mock_video_clip, width=1280, height=720)
-        mock_video_clip.resized.assert_called_with((1280, 720))
-
-    def test_apply_rotate_angle(self, mock_video_clip):
-        """Apply rotate should accept numeric angle."""
-        apply_rotate(mock_video_clip, 45.0)
-        mock_video_clip.rotated.assert_called_with(45.0)
-
-    def test_apply_rotate_enum(self, mock_video_clip):
-        """Apply rotate should accept RotationAngle enum."""
-        apply_rotate(mock_video_clip, RotationAngle.CW_90)
-        mock_video_clip.rotated.assert_called_with(90)
+    @pytest.mark.parametrize(
+        ("transform", "args", "kwargs", "clip_method", "expected"),
+        [
+            pytest.param(apply_speed, (2.0,), {}, "with_speed_scaled", call(2.0), id="speed"),
+            pytest.param(apply_reverse, (), {}, "time_mirror", call(), id="reverse"),
+            pytest.param(apply_loop, (3,), {}, "loop", call(n=3), id="loop"),
+            pytest.param(
+                apply_crop,
+                (CropRegion(0, 0, 100, 100),),
+                {},
+                "cropped",
+                call(x1=0, y1=0, x2=100, y2=100),
+                id="crop",
+            ),
+            pytest.param(
+                apply_resize,
+                (),
+                {"width": 1280},
+                "resized",
+                call(width=1280),
+                id="resize_width_only",
+            ),
+            pytest.param(
+                apply_resize,
+                (),
+                {"width": 1280, "height": 720},
+                "resized",
+                call((1280, 720)),
+                id="resize_both",
+            ),
+            pytest.param(apply_rotate, (45.0,), {}, "rotated", call(45.0), id="rotate_angle"),
+            pytest.param(
+                apply_rotate, (RotationAngle.CW_90,), {}, "rotated", call(90), id="rotate_enum"
+            ),
+        ],
+    )
+    def test_transform(self, transform, args, kwargs, clip_method, expected, mock_video_clip):
+        """Each transform should make a single call to the matching clip method."""
+        transform(mock_video_clip, *args, **kwargs)
+
+        assert getattr(mock_video_clip, clip_method).call_args_list == [expected]